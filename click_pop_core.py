@@ -1,8 +1,45 @@
-def find_display_for_point(x, y, displays):
+import heapq
+
+
+# Edge length (px) of the grid cells used by build_display_index.
+DISPLAY_INDEX_CELL = 512
+
+# Clicks this close (px) to the previous one in a tick are coalesced.
+COALESCE_RADIUS = 3
+
+
+def build_display_index(displays, cell=DISPLAY_INDEX_CELL):
+    """Bucket *displays* into a uniform grid for fast hit-testing.
+
+    Returns ``{(cx, cy): [(left, top, right, bottom, display), ...]}``
+    where each display is listed, with its precomputed exclusive bounds, in
+    every *cell*-sized grid cell its bounds overlap.  Rebuild whenever the
+    display list changes.
+    """
+    index = {}
+    for d in displays:
+        if d["w"] <= 0 or d["h"] <= 0:
+            continue
+        entry = (d["x"], d["y"], d["x"] + d["w"], d["y"] + d["h"], d)
+        for cx in range(d["x"] // cell, (d["x"] + d["w"] - 1) // cell + 1):
+            for cy in range(d["y"] // cell, (d["y"] + d["h"] - 1) // cell + 1):
+                index.setdefault((cx, cy), []).append(entry)
+    return index
+
+
+def find_display_for_point(x, y, displays, index=None, cell=DISPLAY_INDEX_CELL):
     """Return the display dict whose bounds contain (x, y), or None.
 
     Each display dict must have keys: x, y, w, h (origin and logical size).
+    When *index* (from :func:`build_display_index` over the same
+    *displays*) is given, only the displays bucketed in the point's grid
+    cell are tested — usually one — against their precomputed bounds.
     """
+    if index is not None:
+        for left, top, right, bottom, d in index.get((x // cell, y // cell), ()):
+            if left <= x < right and top <= y < bottom:
+                return d
+        return None
     for d in displays:
         if d["x"] <= x < d["x"] + d["w"] and d["y"] <= y < d["y"] + d["h"]:
             return d
@@ -11,7 +48,7 @@ def find_display_for_point(x, y, displays):
 
 def map_coords(x, y, canvas_w, canvas_h, monitor_w, monitor_h, circle_size,
                crop_left=0, crop_top=0, capture_pos_x=0, capture_pos_y=0,
-               capture_scale_x=None, capture_scale_y=None):
+               capture_scale_x=None, capture_scale_y=None, retina=1.0):
     """Map mouse coordinates to OBS canvas coordinates, centered on the circle.
 
     When *capture_scale_x/y* are provided (i.e. a Display Capture with known
@@ -19,8 +56,16 @@ def map_coords(x, y, canvas_w, canvas_h, monitor_w, monitor_h, circle_size,
     the item's transform in the scene.  Otherwise falls back to simple
     proportional mapping across the full monitor.
 
+    *retina* is the backing scale of logical (x, y, monitor size) into the
+    physical pixels that crops and capture scales are expressed in.
+
     Returns (obs_x, obs_y).
     """
+    if retina != 1.0:
+        x *= retina
+        y *= retina
+        monitor_w *= retina
+        monitor_h *= retina
     if capture_scale_x is None:
         capture_scale_x = canvas_w / monitor_w
     if capture_scale_y is None:
@@ -33,44 +78,123 @@ def map_coords(x, y, canvas_w, canvas_h, monitor_w, monitor_h, circle_size,
     return (obs_x, obs_y)
 
 
-def allocate_slot(prefix, max_circles, active_clicks):
-    """Find a free slot or evict the oldest entry for *prefix*.
+def coord_affine(canvas_w, canvas_h, monitor_w, monitor_h, circle_size,
+                 crop_left=0, crop_top=0, capture_pos_x=0, capture_pos_y=0,
+                 capture_scale_x=None, capture_scale_y=None, retina=1.0):
+    """Fold the :func:`map_coords` arguments into a per-axis affine map.
+
+    Takes the same arguments as :func:`map_coords` minus the point, and
+    returns ``(scale_x, scale_y, off_x, off_y)`` such that
+    ``obs_x = x * scale_x + off_x`` (likewise for y).  *retina* is folded
+    into the scale, so *x* / *y* stay in logical units.  The result only
+    changes with the mapping parameters, so callers can cache it.
+    """
+    if capture_scale_x is None:
+        capture_scale_x = canvas_w / (monitor_w * retina)
+    if capture_scale_y is None:
+        capture_scale_y = canvas_h / (monitor_h * retina)
 
-    *active_clicks* is a list of ``(source_name, expire_time)`` tuples and
-    **may be mutated** (the evicted entry is removed in-place so the caller
-    doesn't double-count it).
+    off_x = capture_pos_x - crop_left * capture_scale_x - circle_size / 2
+    off_y = capture_pos_y - crop_top * capture_scale_y - circle_size / 2
+    return (capture_scale_x * retina, capture_scale_y * retina, off_x, off_y)
 
-    Returns ``(slot_name, evicted_name | None)``.
+
+def slot_names(prefix, count):
+    """Return the *count* pooled source names ``prefix0 .. prefix{count-1}``.
+
+    Build once per settings change and pass to :func:`next_slot`, so
+    allocation never formats a string.
     """
-    # Try to find a free slot
-    for i in range(max_circles):
-        candidate = f"{prefix}{i}"
-        in_use = any(n == candidate for n, _ in active_clicks)
-        if not in_use:
-            return (candidate, None)
+    return [f"{prefix}{i}" for i in range(count)]
 
-    # All slots busy — evict the oldest matching this prefix
-    for i, (n, _) in enumerate(active_clicks):
-        if n.startswith(prefix):
-            active_clicks.pop(i)
-            return (n, n)
 
-    # Fallback (shouldn't happen if active_clicks is consistent)
-    return (f"{prefix}0", None)
+def next_slot(names, cursor, active_clicks):
+    """Pick a slot in the pool *names* for a new circle, round-robin.
+
+    *cursor* is the caller's round-robin position.  The first slot from
+    ``cursor % len(names)`` onward with no circle showing is taken.  If
+    every slot is busy, the pool's circle that expires soonest is evicted
+    from the *active_clicks* heap in-place and its slot reused — the
+    cursor alone can't be trusted to point at that one once the pool has
+    been resized or the duration shortened.
+
+    Returns ``(slot_index, evicted_name | None)``; the caller continues
+    from ``slot_index + 1``.
+    """
+    count = len(names)
+    busy = {name for _, name in active_clicks}
+    start = cursor % count
+    for k in range(count):
+        slot = (start + k) % count
+        if names[slot] not in busy:
+            return (slot, None)
+
+    pool = set(names)
+    oldest = min((i for i, (_, name) in enumerate(active_clicks)
+                  if name in pool),
+                 key=lambda i: active_clicks[i])
+    evicted = active_clicks[oldest][1]
+    active_clicks[oldest] = active_clicks[-1]
+    active_clicks.pop()
+    heapq.heapify(active_clicks)
+    return (names.index(evicted), evicted)
 
 
 def expire_circles(active_clicks, now):
-    """Partition *active_clicks* into still-active and expired.
+    """Pop expired entries off the *active_clicks* heap.
+
+    *active_clicks* is a min-heap of ``(expire_time, source_name)`` tuples.
+    Yields the source name of every entry whose expire time is ``<= now``,
+    removing it from the heap as it goes; entries still active are left
+    untouched.  When nothing has expired this is a single comparison
+    against the heap top.
+    """
+    while active_clicks and active_clicks[0][0] <= now:
+        yield heapq.heappop(active_clicks)[1]
+
+
+def coalesce_clicks(clicks, radius=COALESCE_RADIUS):
+    """Collapse repeated clicks at (nearly) the same spot into one.
+
+    *clicks* is a sequence of ``(x, y, is_left)`` tuples drained in one
+    tick.  Exact repeats are dropped, as is a click within *radius* px
+    (Manhattan distance) of the previous kept click of the same button —
+    so an auto-fire or a jittery multi-click re-positions one circle
+    instead of one per click.  Order follows the kept clicks.
+    """
+    kept = []
+    seen = set()
+    last = {}  # {is_left: (x, y)} of the previous kept click
+    for click in clicks:
+        if click in seen:
+            continue
+        x, y, is_left = click
+        prev = last.get(is_left)
+        if prev is not None and abs(prev[0] - x) + abs(prev[1] - y) <= radius:
+            continue
+        kept.append(click)
+        seen.add(click)
+        last[is_left] = (x, y)
+    return kept
+
+
+def trim_to_pool(clicks, max_circles):
+    """Keep only the newest *max_circles* clicks of each button.
 
-    Returns ``(still_active, expired_names)`` where *still_active* has the
-    same ``(name, expire_time)`` shape and *expired_names* is a plain list
-    of source names.
+    *clicks* is an oldest-first sequence of ``(x, y, is_left)`` tuples,
+    the clicks of one tick that will actually be placed (discarded clicks
+    must be filtered out first, or they would crowd out placed ones).
+    Each button has a pool of *max_circles* sources, so any older click
+    would be shown and then evicted within the same tick — drop it up
+    front.  Order of the kept clicks is preserved.
     """
-    still_active = []
-    expired_names = []
-    for name, expire_t in active_clicks:
-        if now >= expire_t:
-            expired_names.append(name)
-        else:
-            still_active.append((name, expire_t))
-    return (still_active, expired_names)
+    if len(clicks) <= max_circles:
+        return clicks
+    remaining = {True: max_circles, False: max_circles}
+    kept = []
+    for click in reversed(clicks):
+        if remaining[click[2]]:
+            remaining[click[2]] -= 1
+            kept.append(click)
+    kept.reverse()
+    return kept
@@ -2,16 +2,27 @@ import obspython as obs
 import sys
 import time
 import os
-from collections import deque
+import re
+import heapq
+import json
+import subprocess
 
-from click_pop_core import map_coords, allocate_slot, expire_circles, find_display_for_point
+from click_pop_core import (coord_affine, next_slot, expire_circles,
+                            find_display_for_point, build_display_index,
+                            coalesce_clicks, slot_names, trim_to_pool)
 
 
 # ---------------------------------------------------------------------------
 # Display detection
 # ---------------------------------------------------------------------------
 
-def _detect_all_displays():
+# Enumerated displays are reused for this long (seconds) — the platform
+# probes can stall for hundreds of ms, and settings edits re-enumerate.
+_DISPLAY_CACHE_TTL = 5.0
+_display_cache = {"ts": 0.0, "value": None}
+
+
+def _detect_all_displays(force=False):
     """Return a list of display descriptors for all connected monitors.
 
     Each descriptor is a dict with keys:
@@ -19,23 +30,28 @@ def _detect_all_displays():
       x, y          – origin in virtual desktop space (logical points)
       w, h          – logical resolution
       retina_scale  – backing scale factor (2.0 on macOS Retina, else 1.0)
+      phys_w/phys_h – physical pixel size (w/h times retina_scale)
 
     Falls back to a single 1920x1080 display if detection fails.
+
+    The result is cached for ``_DISPLAY_CACHE_TTL`` seconds; *force*
+    re-probes regardless (the "Refresh displays" button).
     """
-    import subprocess
+    now = time.monotonic()
+    cached = _display_cache["value"]
+    if (not force and cached is not None
+            and now - _display_cache["ts"] < _DISPLAY_CACHE_TTL):
+        return cached
     displays = []
     try:
-        if sys.platform == "win32":
-            displays = _detect_displays_win32()
-        elif sys.platform == "darwin":
-            displays = _detect_displays_macos()
-        else:
-            displays = _detect_displays_linux()
+        displays = _detect_displays_impl()
     except Exception:
         pass
     if not displays:
         displays = [{"id": 0, "x": 0, "y": 0, "w": 1920, "h": 1080,
-                      "retina_scale": 1.0}]
+                      "retina_scale": 1.0, "phys_w": 1920, "phys_h": 1080}]
+    _display_cache["ts"] = now
+    _display_cache["value"] = displays
     return displays
 
 
@@ -61,27 +77,27 @@ def _detect_displays_macos():
         except Exception:
             pass
         displays.append({"id": did, "x": x, "y": y, "w": w, "h": h,
-                          "retina_scale": retina_scale})
+                          "retina_scale": retina_scale,
+                          # Physical pixel size, as capture sources report it
+                          "phys_w": int(w * retina_scale),
+                          "phys_h": int(h * retina_scale)})
     return displays
 
 
-def _detect_displays_win32():
-    """Enumerate displays on Windows via ctypes.
+_win32_api = None         # (user32, DISPLAY_DEVICEW, enum callback) once built
+_win32_monitors = []      # filled by the persistent EnumDisplayMonitors callback
 
-    Returns display rects in physical-pixel coordinates so they match the
-    coordinate space that pynput's WH_MOUSE_LL hook reports.
 
-    Each display dict includes:
-      - ``device_name``: GDI name like ``\\\\.\\DISPLAY1``
-      - ``device_path``: PnP device interface path used by OBS 28+ as
-        ``monitor_id`` (e.g. ``\\\\?\\DISPLAY#...#{guid}``)
+def _load_win32():
+    """Declare the user32 calls, structs and enum callback once.
 
-    To get physical-pixel rects we temporarily set the calling thread's DPI
-    awareness to Per-Monitor Aware V2 before calling EnumDisplayMonitors.
-    On older Windows (pre-1607) where SetThreadDpiAwarenessContext is
-    unavailable the call is skipped — at 100 % scaling the coordinates
-    already match.
+    The ``MONITORENUMPROC`` trampoline is built a single time and kept
+    alive here; it appends to ``_win32_monitors``.
     """
+    global _win32_api
+    if _win32_api is not None:
+        return _win32_api
+
     import ctypes
     import ctypes.wintypes
 
@@ -106,7 +122,6 @@ def _detect_displays_win32():
             ("DeviceKey", ctypes.c_wchar * 128),
         ]
 
-    displays = []
     user32 = ctypes.windll.user32
 
     user32.GetMonitorInfoW.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
@@ -118,6 +133,71 @@ def _detect_displays_win32():
     ]
     user32.EnumDisplayDevicesW.restype = ctypes.wintypes.BOOL
 
+    # HMONITOR and HDC are pointer-sized handles (8 bytes on 64-bit).
+    # LPARAM is also pointer-sized.
+    MONITORENUMPROC = ctypes.WINFUNCTYPE(
+        ctypes.c_int,
+        ctypes.c_void_p,   # hMonitor
+        ctypes.c_void_p,   # hdcMonitor
+        ctypes.POINTER(ctypes.wintypes.RECT),  # lprcMonitor
+        ctypes.wintypes.LPARAM,                 # dwData
+    )
+
+    def callback(hMonitor, hdcMonitor, lprcMonitor, dwData):
+        r = lprcMonitor[0]
+
+        # Get GDI device name (e.g. \\.\DISPLAY1) via GetMonitorInfoW.
+        device_name = ""
+        try:
+            info = MONITORINFOEXW()
+            info.cbSize = ctypes.sizeof(MONITORINFOEXW)
+            if user32.GetMonitorInfoW(hMonitor, ctypes.byref(info)):
+                device_name = info.szDevice
+        except Exception:
+            pass
+
+        _win32_monitors.append({
+            "id": hMonitor,
+            "x": r.left, "y": r.top,
+            "w": r.right - r.left, "h": r.bottom - r.top,
+            "retina_scale": 1.0,
+            "phys_w": r.right - r.left, "phys_h": r.bottom - r.top,
+            "device_name": device_name,
+            "device_path": "",
+        })
+        return 1  # continue enumeration
+
+    user32.EnumDisplayMonitors.argtypes = [
+        ctypes.c_void_p, ctypes.c_void_p, MONITORENUMPROC,
+        ctypes.wintypes.LPARAM,
+    ]
+    user32.EnumDisplayMonitors.restype = ctypes.wintypes.BOOL
+
+    _win32_api = (user32, DISPLAY_DEVICEW, MONITORENUMPROC(callback))
+    return _win32_api
+
+
+def _detect_displays_win32():
+    """Enumerate displays on Windows via ctypes.
+
+    Returns display rects in physical-pixel coordinates so they match the
+    coordinate space that pynput's WH_MOUSE_LL hook reports.
+
+    Each display dict includes:
+      - ``device_name``: GDI name like ``\\\\.\\DISPLAY1``
+      - ``device_path``: PnP device interface path used by OBS 28+ as
+        ``monitor_id`` (e.g. ``\\\\?\\DISPLAY#...#{guid}``)
+
+    To get physical-pixel rects we temporarily set the calling thread's DPI
+    awareness to Per-Monitor Aware V2 before calling EnumDisplayMonitors.
+    On older Windows (pre-1607) where SetThreadDpiAwarenessContext is
+    unavailable the call is skipped — at 100 % scaling the coordinates
+    already match.
+    """
+    import ctypes
+
+    user32, DISPLAY_DEVICEW, enum_callback = _load_win32()
+
     # --- Temporarily switch to per-monitor DPI awareness (v2) -----------
     # DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2 = -4
     DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2 = ctypes.c_void_p(-4)
@@ -132,41 +212,9 @@ def _detect_displays_win32():
         # Pre-Windows 10 1607 — function doesn't exist; proceed without it.
         pass
 
+    _win32_monitors.clear()
     try:
-        # HMONITOR and HDC are pointer-sized handles (8 bytes on 64-bit).
-        # LPARAM is also pointer-sized.
-        MONITORENUMPROC = ctypes.WINFUNCTYPE(
-            ctypes.c_int,
-            ctypes.c_void_p,   # hMonitor
-            ctypes.c_void_p,   # hdcMonitor
-            ctypes.POINTER(ctypes.wintypes.RECT),  # lprcMonitor
-            ctypes.wintypes.LPARAM,                 # dwData
-        )
-
-        def callback(hMonitor, hdcMonitor, lprcMonitor, dwData):
-            r = lprcMonitor[0]
-
-            # Get GDI device name (e.g. \\.\DISPLAY1) via GetMonitorInfoW.
-            device_name = ""
-            try:
-                info = MONITORINFOEXW()
-                info.cbSize = ctypes.sizeof(MONITORINFOEXW)
-                if user32.GetMonitorInfoW(hMonitor, ctypes.byref(info)):
-                    device_name = info.szDevice
-            except Exception:
-                pass
-
-            displays.append({
-                "id": hMonitor,
-                "x": r.left, "y": r.top,
-                "w": r.right - r.left, "h": r.bottom - r.top,
-                "retina_scale": 1.0,
-                "device_name": device_name,
-                "device_path": "",
-            })
-            return 1  # continue enumeration
-
-        user32.EnumDisplayMonitors(None, None, MONITORENUMPROC(callback), 0)
+        user32.EnumDisplayMonitors(None, None, enum_callback, 0)
     finally:
         # --- Restore previous DPI awareness context ---------------------
         if old_ctx is not None:
@@ -174,6 +222,7 @@ def _detect_displays_win32():
                 user32.SetThreadDpiAwarenessContext(old_ctx)
             except (OSError, AttributeError):
                 pass
+    displays = list(_win32_monitors)
 
     # --- Resolve PnP device interface paths for each display ------------
     # OBS 28+ stores monitor_id as a device interface path (e.g.
@@ -197,46 +246,267 @@ def _detect_displays_win32():
     return displays
 
 
+# xrandr geometry "WxH+X+Y", e.g. "1920x1080+1920+0" (matched on raw bytes)
+_XRANDR_GEOMETRY_RE = re.compile(rb"(\d+)x(\d+)\+(\d+)\+(\d+)")
+
+
 def _detect_displays_linux():
-    """Enumerate displays on Linux via xrandr."""
-    import subprocess, re
-    out = subprocess.check_output(["xrandr", "--query"], text=True, timeout=5)
+    """Enumerate displays on Linux via XRandR, falling back to xrandr(1)."""
+    try:
+        displays = _detect_displays_xrandr_lib()
+    except OSError:
+        displays = []
+    return displays or _detect_displays_xrandr_cli()
+
+
+def _detect_displays_xrandr_cli():
+    """Enumerate displays by parsing ``xrandr --current``.
+
+    ``--current`` reads the server's cached configuration; ``--query``
+    re-probes every output and can freeze the display for seconds.
+    """
+    out = subprocess.check_output(["xrandr", "--current"], timeout=5)
     displays = []
     idx = 0
-    for m in re.finditer(r"(\d+)x(\d+)\+(\d+)\+(\d+)", out):
+    # Only output header lines ("HDMI-1 connected primary 1920x1080+0+0 ...")
+    # carry a geometry — skip the per-mode rows without decoding anything.
+    for line in out.splitlines():
+        if b" connected " not in line:
+            continue
+        m = _XRANDR_GEOMETRY_RE.search(line)
+        if m is None:
+            continue
         w, h, x, y = int(m.group(1)), int(m.group(2)), int(m.group(3)), int(m.group(4))
         displays.append({"id": idx, "x": x, "y": y, "w": w, "h": h,
-                          "retina_scale": 1.0})
+                          "retina_scale": 1.0, "phys_w": w, "phys_h": h})
         idx += 1
     return displays
 
 
+_xrandr_api = None        # (libX11, libXrandr) once loaded, False if unavailable
+
+
+def _load_xrandr():
+    """Load libX11 / libXrandr once and declare the calls we use.
+
+    Raises ``OSError`` if the libraries aren't available or lack a call.
+    """
+    global _xrandr_api
+    if _xrandr_api is False:
+        raise OSError("libXrandr unavailable")
+    if _xrandr_api is not None:
+        return _xrandr_api
+
+    import ctypes
+
+    class XRRScreenResources(ctypes.Structure):
+        _fields_ = [
+            ("timestamp", ctypes.c_ulong),
+            ("configTimestamp", ctypes.c_ulong),
+            ("ncrtc", ctypes.c_int),
+            ("crtcs", ctypes.POINTER(ctypes.c_ulong)),
+            ("noutput", ctypes.c_int),
+            ("outputs", ctypes.POINTER(ctypes.c_ulong)),
+            ("nmode", ctypes.c_int),
+            ("modes", ctypes.c_void_p),
+        ]
+
+    # Leading fields of XRRCrtcInfo — only ever read through a pointer.
+    class XRRCrtcInfo(ctypes.Structure):
+        _fields_ = [
+            ("timestamp", ctypes.c_ulong),
+            ("x", ctypes.c_int),
+            ("y", ctypes.c_int),
+            ("width", ctypes.c_uint),
+            ("height", ctypes.c_uint),
+            ("mode", ctypes.c_ulong),
+        ]
+
+    # Leading fields of XRROutputInfo — likewise read through a pointer.
+    class XRROutputInfo(ctypes.Structure):
+        _fields_ = [
+            ("timestamp", ctypes.c_ulong),
+            ("crtc", ctypes.c_ulong),
+            ("name", ctypes.c_char_p),
+            ("nameLen", ctypes.c_int),
+            ("mm_width", ctypes.c_ulong),
+            ("mm_height", ctypes.c_ulong),
+            ("connection", ctypes.c_ushort),
+        ]
+
+    try:
+        x11 = ctypes.cdll.LoadLibrary("libX11.so.6")
+        xrandr = ctypes.cdll.LoadLibrary("libXrandr.so.2")
+        _declare_xrandr(x11, xrandr, ctypes.POINTER(XRRScreenResources),
+                        ctypes.POINTER(XRRCrtcInfo),
+                        ctypes.POINTER(XRROutputInfo))
+    except (OSError, AttributeError) as exc:
+        # AttributeError: a library too old to export one of the calls
+        _xrandr_api = False
+        raise OSError(f"libXrandr unavailable: {exc}") from exc
+
+    _xrandr_api = (x11, xrandr)
+    return _xrandr_api
+
+
+def _declare_xrandr(x11, xrandr, res_p, crtc_p, output_p):
+    """Set argtypes / restype on the libX11 / libXrandr calls we use.
+
+    Raises ``AttributeError`` if a library lacks one of them.
+    """
+    import ctypes
+
+    x11.XOpenDisplay.argtypes = [ctypes.c_char_p]
+    x11.XOpenDisplay.restype = ctypes.c_void_p
+    x11.XDefaultRootWindow.argtypes = [ctypes.c_void_p]
+    x11.XDefaultRootWindow.restype = ctypes.c_ulong
+    x11.XCloseDisplay.argtypes = [ctypes.c_void_p]
+    x11.XCloseDisplay.restype = ctypes.c_int
+
+    # Not XRRGetScreenResources — that one re-probes the outputs.
+    xrandr.XRRGetScreenResourcesCurrent.argtypes = [ctypes.c_void_p, ctypes.c_ulong]
+    xrandr.XRRGetScreenResourcesCurrent.restype = res_p
+    xrandr.XRRFreeScreenResources.argtypes = [res_p]
+    xrandr.XRRFreeScreenResources.restype = None
+    xrandr.XRRGetCrtcInfo.argtypes = [ctypes.c_void_p, res_p, ctypes.c_ulong]
+    xrandr.XRRGetCrtcInfo.restype = crtc_p
+    xrandr.XRRFreeCrtcInfo.argtypes = [crtc_p]
+    xrandr.XRRFreeCrtcInfo.restype = None
+    xrandr.XRRGetOutputInfo.argtypes = [ctypes.c_void_p, res_p, ctypes.c_ulong]
+    xrandr.XRRGetOutputInfo.restype = output_p
+    xrandr.XRRFreeOutputInfo.argtypes = [output_p]
+    xrandr.XRRFreeOutputInfo.restype = None
+
+
+def _detect_displays_xrandr_lib():
+    """Enumerate connected outputs through libXrandr — no process spawn.
+
+    Walks outputs (not CRTCs) so the display ids follow output order, the
+    order OBS's xshm capture numbers its screens in and ``xrandr(1)``
+    lists them in.  Raises ``OSError`` if the libraries or the X display
+    are unavailable.
+    """
+    x11, xrandr = _load_xrandr()
+    dpy = x11.XOpenDisplay(None)
+    if not dpy:
+        raise OSError("cannot open X display")
+    displays = []
+    try:
+        res = xrandr.XRRGetScreenResourcesCurrent(dpy, x11.XDefaultRootWindow(dpy))
+        if not res:
+            return displays
+        try:
+            for i in range(res.contents.noutput):
+                out = xrandr.XRRGetOutputInfo(dpy, res, res.contents.outputs[i])
+                if not out:
+                    continue
+                crtc = out.contents.crtc
+                connected = out.contents.connection == 0  # RR_Connected
+                xrandr.XRRFreeOutputInfo(out)
+                if not (connected and crtc):  # off or unplugged
+                    continue
+                info = xrandr.XRRGetCrtcInfo(dpy, res, crtc)
+                if not info:
+                    continue
+                c = info.contents
+                if c.mode and c.width and c.height:
+                    displays.append({"id": len(displays), "x": c.x, "y": c.y,
+                                     "w": c.width, "h": c.height,
+                                     "retina_scale": 1.0,
+                                     "phys_w": c.width, "phys_h": c.height})
+                xrandr.XRRFreeCrtcInfo(info)
+        finally:
+            xrandr.XRRFreeScreenResources(res)
+    finally:
+        x11.XCloseDisplay(dpy)
+    return displays
+
+
+# Platform display enumerator, picked once at import.
+_detect_displays_impl = {
+    "win32": _detect_displays_win32,
+    "darwin": _detect_displays_macos,
+}.get(sys.platform, _detect_displays_linux)
+
+
 def _detect_screen_size():
     """Return (width, height) of the primary screen, or (1920, 1080).
 
     Thin wrapper for backward compatibility — uses the first display from
-    ``_detect_all_displays()``.
+    ``_detect_all_displays()``.  The result is memoized for the session;
+    ``_refresh_displays`` (the "Refresh displays" button) re-detects it.
     """
-    global _retina_scale, _all_displays
-    _all_displays = _detect_all_displays()
+    global _retina_scale, _screen_size
+    if _screen_size is not None:
+        return _screen_size
+    _set_displays(_detect_all_displays())
+    _screen_size = (1920, 1080)
     if _all_displays:
         d = _all_displays[0]
         _retina_scale = d.get("retina_scale", 1.0)
-        return (d["w"], d["h"])
-    return (1920, 1080)
+        _screen_size = (d["w"], d["h"])
+    return _screen_size
 
 # ---------------------------------------------------------------------------
 # Globals
 # ---------------------------------------------------------------------------
 _listener = None          # pynput Listener thread
-_click_queue = deque()    # thread‑safe (deque.append / popleft are atomic in CPython)
+_click_ring = [None] * 1024  # fixed-capacity SPSC ring of (x, y, is_left) clicks
+_ring_head = 0            # next slot to read — only the OBS timer writes this
+_ring_tail = 0            # next slot to write — only the pynput thread writes this
 _timer_active = False
-_active_clicks = []       # list of (source_name, expire_time)
+_active_clicks = []       # min-heap of (expire_time, source_name)
+_screen_size = None       # memoized (w, h) of the primary display
 _retina_scale = 1.0       # macOS Retina backing scale factor (2.0 on HiDPI)
 _all_displays = []        # list of display descriptors from _detect_all_displays()
+_display_index = {}       # grid index over _all_displays (build_display_index)
+_desktop_bounds = (0, 0, 0, 0)  # (left, top, right, bottom) over _all_displays
+_last_display = None      # display the previous click landed on
+_last_bounds = None       # (left, top, right, bottom) of _last_display
 _captured_display = None  # display dict for the monitor being captured (or None)
 _display_capture_map = {}    # {display_id: {"display": dict, "source_name": str}}
 _multi_capture_mode = False  # True when "(all)" is selected
+_transform_cache = {}        # {capture_source_name: transform tuple | None}
+_transform_cache_dirty = True
+_signal_refs = []            # [(source, signal_handler, signals)] we hold refs for
+_weak_signal_refs = []       # [(weak source, signals)] watched without a ref
+_watched_groups = set()      # names of group scenes watched for a grouped capture item
+_current_scene_src = None    # current scene source, ref held in _signal_refs
+_current_scene = None        # obs_scene_from_source(_current_scene_src)
+_source_image_cache = {}     # {source_name: image path last applied}
+_scene_item_cache = {}       # {source_name: scene item} in the current scene
+_scale_cache = {}            # {source_name: (circle_size, source_width) last applied}
+_pos_cache = {}              # {source_name: (x, y) last applied}
+_capture_item_cache = {}     # {capture source name: scene item} in the current scene
+_fast_mapping_cache = {}     # 1-entry {(canvas_w, canvas_h): (scale_x, scale_y, half_size)}
+_affine_cache = {}           # {_click_mapping params: coord_affine(...)}
+_AFFINE_CACHE_MAX = 16
+
+# Reused vec2 arguments for the per-click setters (libobs copies them).
+_pos_vec = obs.vec2()
+_scale_vec = obs.vec2()
+
+# obspython functions on the per-click / per-tick path, bound once so each
+# call is a global lookup rather than an attribute lookup on the module.
+_frontend_get_current_scene = obs.obs_frontend_get_current_scene
+_scene_from_source = obs.obs_scene_from_source
+_scene_find_source = obs.obs_scene_find_source
+_source_get_width = obs.obs_source_get_width
+_source_get_height = obs.obs_source_get_height
+_source_release = obs.obs_source_release
+_sceneitem_get_source = obs.obs_sceneitem_get_source
+_sceneitem_set_pos = obs.obs_sceneitem_set_pos
+_sceneitem_set_scale = obs.obs_sceneitem_set_scale
+_sceneitem_set_visible = obs.obs_sceneitem_set_visible
+_sceneitem_defer_update_begin = obs.obs_sceneitem_defer_update_begin
+_sceneitem_defer_update_end = obs.obs_sceneitem_defer_update_end
+
+# Name prefixes of the pooled circle sources (suffixed with a slot index).
+_CIRCLE_PREFIX = "__click_pop_"
+_LEFT_PREFIX = "__click_pop_L_"
+_RIGHT_PREFIX = "__click_pop_R_"
+_slot_pools = {}             # {prefix: [slot source names]} sized to max_circles
+_slot_cursors = {_LEFT_PREFIX: 0, _RIGHT_PREFIX: 0}  # round-robin position per pool
 
 # Label used in the editable combo for multi-capture mode.
 # OBS_COMBO_TYPE_EDITABLE stores the label text as the setting value,
@@ -380,6 +650,10 @@ def script_defaults(settings):
 
 
 def script_update(settings):
+    _source_image_cache.clear()
+    _scale_cache.clear()
+    _fast_mapping_cache.clear()
+    _capture_item_cache.clear()
     _settings["left_image"] = obs.obs_data_get_string(settings, "left_image")
     _settings["right_image"] = obs.obs_data_get_string(settings, "right_image")
     _settings["duration_ms"] = obs.obs_data_get_int(settings, "duration_ms")
@@ -391,6 +665,10 @@ def script_update(settings):
     _settings["capture_source"] = obs.obs_data_get_string(settings, "capture_source")
     # Re-resolve which display is being captured when settings change
     _refresh_displays()
+    # The capture source may have changed — watch the new one instead
+    _invalidate_transform_cache()
+    if _listener is not None:
+        _connect_scene_signals()
     # Auto-set monitor dimensions from captured display when not overridden
     if not _settings["override_monitor"]:
         if _captured_display is not None:
@@ -399,21 +677,51 @@ def script_update(settings):
 
 
 def script_unload():
+    global _file_settings
     _stop_listener()
     _cleanup_sources()
+    if _file_settings is not None:
+        obs.obs_data_release(_file_settings)
+        _file_settings = None
 
 
 # ---------------------------------------------------------------------------
 # Listener management
 # ---------------------------------------------------------------------------
 
-def _refresh_displays():
-    """Re-enumerate displays and resolve the captured display."""
-    global _all_displays, _retina_scale
-    _all_displays = _detect_all_displays()
+def _set_displays(displays):
+    """Install *displays* as the current layout and precompute its lookups.
+
+    Builds the grid index and the virtual-desktop bounds once per layout
+    so clicks never derive them, and forgets the previous click's display.
+    """
+    global _all_displays, _display_index, _desktop_bounds
+    global _last_display, _last_bounds
+    _all_displays = displays
+    _display_index = build_display_index(displays)
+    if displays:
+        _desktop_bounds = (min(d["x"] for d in displays),
+                           min(d["y"] for d in displays),
+                           max(d["x"] + d["w"] for d in displays),
+                           max(d["y"] + d["h"] for d in displays))
+    else:
+        _desktop_bounds = (0, 0, 0, 0)
+    _last_display = None
+    _last_bounds = None
+
+
+def _refresh_displays(force=False):
+    """Re-enumerate displays and resolve the captured display.
+
+    *force* bypasses the display enumeration cache.
+    """
+    global _retina_scale, _screen_size
+    _set_displays(_detect_all_displays(force))
+    _uuid_cache.clear()
     # Update _retina_scale from the primary display for backward compat
     if _all_displays:
         _retina_scale = _all_displays[0].get("retina_scale", 1.0)
+        _screen_size = (_all_displays[0]["w"], _all_displays[0]["h"])
     try:
         _resolve_captured_display()
     except Exception:
@@ -448,7 +756,12 @@ def _refresh_displays():
 
 
 def _on_refresh_displays(props, prop):
-    _refresh_displays()
+    _refresh_displays(force=True)
+    # Also the manual escape hatch for edits OBS doesn't signal (e.g. a
+    # Crop/Pad filter's own settings) — re-read transforms on next click.
+    _invalidate_transform_cache()
+    if _listener is not None:
+        _connect_scene_signals()
     # Repopulate the Display Capture source dropdown
     capture_list = obs.obs_properties_get(props, "capture_source")
     if capture_list is not None:
@@ -492,7 +805,8 @@ def _start_listener():
     def on_click(x, y, button, pressed):
         if pressed:
             is_left = (button == Button.left)
-            _click_queue.append((x, y, is_left, time.time()))
+            # Timestamped by the poller — keep the listener thread minimal
+            _enqueue_click((x, y, is_left))
 
     _listener = Listener(on_click=on_click)
     _listener.daemon = True
@@ -500,7 +814,9 @@ def _start_listener():
 
     if not _timer_active:
         obs.timer_add(_poll_clicks, 16)  # ~60 fps polling
+        obs.obs_frontend_add_event_callback(_on_frontend_event)
         _timer_active = True
+    _connect_scene_signals()
 
     obs.script_log(obs.LOG_INFO, "Click Pop: listener started")
 
@@ -513,21 +829,44 @@ def _stop_listener():
 
     if _timer_active:
         obs.timer_remove(_poll_clicks)
+        obs.obs_frontend_remove_event_callback(_on_frontend_event)
         _timer_active = False
+    _disconnect_scene_signals()
+    # Nothing tells us about scene changes any more
+    _scene_item_cache.clear()
+    _capture_item_cache.clear()
 
     obs.script_log(obs.LOG_INFO, "Click Pop: listener stopped")
 
 
+def _on_frontend_event(event):
+    # A different scene means different scene items — re-watch and re-read.
+    # (_connect_scene_signals also drops the transform and scene-item caches.)
+    if event == obs.OBS_FRONTEND_EVENT_SCENE_CHANGED:
+        _connect_scene_signals()
+    # The collection is going away — don't keep its scene (and everything
+    # in it) alive; SCENE_CHANGED re-watches the next one.
+    elif event in (obs.OBS_FRONTEND_EVENT_SCENE_COLLECTION_CLEANUP,
+                   obs.OBS_FRONTEND_EVENT_EXIT):
+        _disconnect_scene_signals()
+        _scene_item_cache.clear()
+        _capture_item_cache.clear()
+
+
 # ---------------------------------------------------------------------------
 # Display Capture detection — crop / position / scale
 # ---------------------------------------------------------------------------
 
-_DISPLAY_CAPTURE_PREFIXES = (
-    "xshm_input",         # Linux X11 (xshm_input, xshm_input_v2, …)
+# Unversioned source IDs of Display Capture sources.  Matched against
+# ``obs_source_get_unversioned_id`` so version suffixes (``_v2``) are
+# already stripped; the versioned spelling is listed for safety.
+_DISPLAY_CAPTURE_IDS = frozenset({
+    "xshm_input",         # Linux X11
+    "xshm_input_v2",
     "monitor_capture",    # Windows
     "screen_capture",     # macOS (ScreenCaptureKit)
     "display_capture",    # macOS (legacy)
-)
+})
 
 
 def _iter_display_capture_names():
@@ -536,7 +875,6 @@ def _iter_display_capture_names():
     Uses ``obs_scene_save_transform_states`` to discover source names (avoids
     ``obs_scene_enum_items`` which has a broken SWIG wrapper in OBS ≤32.0.x).
     """
-    import json
     scene_src = obs.obs_frontend_get_current_scene()
     scene = obs.obs_scene_from_source(scene_src)
     obs.obs_source_release(scene_src)
@@ -549,19 +887,35 @@ def _iter_display_capture_names():
     if not json_str:
         return
 
-    parsed = json.loads(json_str)
-    for scene_info in parsed.get("scenes_and_groups", []):
-        for item_info in scene_info.get("items", []):
-            item_id = item_info.get("id")
-            if item_id is None:
-                continue
-            item = obs.obs_scene_find_sceneitem_by_id(scene, item_id)
-            if item is None:
-                continue
-            source = obs.obs_sceneitem_get_source(item)
-            src_id = obs.obs_source_get_unversioned_id(source)
-            if src_id.startswith(_DISPLAY_CAPTURE_PREFIXES):
-                yield obs.obs_source_get_name(source)
+    for item_id in _transform_state_item_ids(json_str):
+        item = obs.obs_scene_find_sceneitem_by_id(scene, item_id)
+        if item is None:
+            continue
+        source = obs.obs_sceneitem_get_source(item)
+        src_id = obs.obs_source_get_unversioned_id(source)
+        if src_id in _DISPLAY_CAPTURE_IDS:
+            yield obs.obs_source_get_name(source)
+
+
+_item_ids_cache = {"json": None, "ids": ()}  # last parsed transform-states JSON
+
+
+def _transform_state_item_ids(json_str):
+    """Return the scene item IDs listed in a transform-states JSON dump.
+
+    The last parse is kept: the dump is identical until items are added,
+    removed or moved, and a Refresh enumerates it more than once.  Only the
+    IDs are cached — names and source types are still read live.
+    """
+    if _item_ids_cache["json"] != json_str:
+        parsed = json.loads(json_str)
+        _item_ids_cache["ids"] = tuple(
+            item_info["id"]
+            for scene_info in parsed.get("scenes_and_groups", [])
+            for item_info in scene_info.get("items", [])
+            if item_info.get("id") is not None)
+        _item_ids_cache["json"] = json_str
+    return _item_ids_cache["ids"]
 
 
 def _populate_capture_list(prop):
@@ -574,48 +928,102 @@ def _populate_capture_list(prop):
                        f"Click Pop: capture list populate failed: {exc}")
 
 
+# Default name OBS gives a newly added Crop/Pad filter (English UI).
+_CROP_FILTER_NAME = "Crop/Pad"
+
+
 def _get_filter_crop(source):
     """Read crop values from a Crop/Pad filter on *source*, if any.
 
-    Iterates the source's filter list via ``obs_source_backup_filters``
-    (avoids the broken callback-based ``obs_source_enum_filters``).
+    The first ``crop_filter`` in filter order wins.  When the source has a
+    single filter it is looked up by its default name and the four ints
+    are read straight from its settings.  Otherwise — several filters,
+    where a renamed Crop/Pad may come before one with the default name, a
+    renamed (or localized) filter, or an OBS without
+    ``obs_source_filter_count`` — the source's filter list is walked in
+    order via ``obs_source_backup_filters`` (avoids the broken
+    callback-based ``obs_source_enum_filters``), which serializes every
+    filter to JSON.
 
     Returns ``(left, top, right, bottom)`` or ``(0, 0, 0, 0)`` if no
     crop filter is found.
     """
-    import json
+    # Most capture sources have no filters at all — skip both lookups.
+    # (obs_source_filter_count is missing from older OBS builds.)
+    filter_count = getattr(obs, "obs_source_filter_count", None)
+    count = filter_count(source) if filter_count is not None else None
+    if count == 0:
+        return (0, 0, 0, 0)
+
+    flt = (obs.obs_source_get_filter_by_name(source, _CROP_FILTER_NAME)
+           if count == 1 else None)
+    if flt is not None:
+        try:
+            if obs.obs_source_get_unversioned_id(flt) == "crop_filter":
+                settings = obs.obs_source_get_settings(flt)
+                crop = (obs.obs_data_get_int(settings, "left"),
+                        obs.obs_data_get_int(settings, "top"),
+                        obs.obs_data_get_int(settings, "right"),
+                        obs.obs_data_get_int(settings, "bottom"))
+                obs.obs_data_release(settings)
+                return crop
+        finally:
+            obs.obs_source_release(flt)
+    return _get_filter_crop_from_backup(source)
+
+
+def _get_filter_crop_from_backup(source):
+    """``_get_filter_crop`` fallback: scan all filters' serialized JSON."""
+    for fobj in _backup_filters(source):
+        if fobj.get("id", "") == "crop_filter":
+            settings = fobj.get("settings", {})
+            return (settings.get("left", 0), settings.get("top", 0),
+                    settings.get("right", 0), settings.get("bottom", 0))
+    return (0, 0, 0, 0)
+
+
+def _crop_filter_names(source):
+    """Return the names of every Crop/Pad filter on *source*, in order.
+
+    Goes through the serialized filter list, so renamed and localized
+    filters are found as well as ones with the default name.
+    """
+    filter_count = getattr(obs, "obs_source_filter_count", None)
+    if filter_count is not None and filter_count(source) == 0:
+        return []
+    return [fobj.get("name", "") for fobj in _backup_filters(source)
+            if fobj.get("id", "") == "crop_filter"]
+
+
+def _backup_filters(source):
+    """Return *source*'s filters as parsed JSON dicts, in filter order.
+
+    Uses ``obs_source_backup_filters`` rather than the broken
+    callback-based ``obs_source_enum_filters``.
+    """
     filters = obs.obs_source_backup_filters(source)
     count = obs.obs_data_array_count(filters)
-    left = top = right = bottom = 0
+    parsed = []
     for i in range(count):
         fdata = obs.obs_data_array_item(filters, i)
         fjson = obs.obs_data_get_json(fdata)
         obs.obs_data_release(fdata)
-        if not fjson:
-            continue
-        fobj = json.loads(fjson)
-        fid = fobj.get("id", "")
-        if fid == "crop_filter":
-            settings = fobj.get("settings", {})
-            left = settings.get("left", 0)
-            top = settings.get("top", 0)
-            right = settings.get("right", 0)
-            bottom = settings.get("bottom", 0)
-            break
+        if fjson:
+            parsed.append(json.loads(fjson))
     obs.obs_data_array_release(filters)
-    return (left, top, right, bottom)
+    return parsed
 
 
-def _display_uuid_via_ctypes(display_id):
-    """Get the UUID string for a CGDirectDisplayID using ctypes.
+_colorsync_api = None     # (ColorSync, CoreFoundation) CDLLs once loaded
+_uuid_cache = {}          # {CGDirectDisplayID: UUID string or None}
 
-    PyObjC doesn't expose ``CGDisplayCreateUUIDFromDisplayID`` in all
-    environments (notably the Python bundled with OBS), so we call the
-    CoreGraphics C function directly via ctypes.
 
-    Returns a UUID string like ``"09FA8E3F-DD10-3AB8-E04B-86F97A791ED1"``
-    or ``None`` on failure.
-    """
+def _load_colorsync():
+    """Load ColorSync / CoreFoundation once and declare the calls we use."""
+    global _colorsync_api
+    if _colorsync_api is not None:
+        return _colorsync_api
+
     import ctypes
 
     # CGDisplayCreateUUIDFromDisplayID lives in the ColorSync framework
@@ -644,10 +1052,40 @@ def _display_uuid_via_ctypes(display_id):
     cf.CFRelease.argtypes = [ctypes.c_void_p]
     cf.CFRelease.restype = None
 
+    _colorsync_api = (cs, cf)
+    return _colorsync_api
+
+
+def _display_uuid_via_ctypes(display_id):
+    """Get the UUID string for a CGDirectDisplayID using ctypes.
+
+    PyObjC doesn't expose ``CGDisplayCreateUUIDFromDisplayID`` in all
+    environments (notably the Python bundled with OBS), so we call the
+    CoreGraphics C function directly via ctypes.
+
+    Results are memoized per display ID until ``_refresh_displays``.
+
+    Returns a UUID string like ``"09FA8E3F-DD10-3AB8-E04B-86F97A791ED1"``
+    or ``None`` on failure.
+    """
+    try:
+        return _uuid_cache[display_id]
+    except KeyError:
+        pass
+    result = _uuid_cache[display_id] = _read_display_uuid(display_id)
+    return result
+
+
+def _read_display_uuid(display_id):
+    """Uncached body of ``_display_uuid_via_ctypes``."""
+    import ctypes
+
+    cs, cf = _load_colorsync()
+
     kCFStringEncodingUTF8 = 0x08000100
 
-    uuid_ref = cs.CGDisplayCreateUUIDFromDisplayID(
-        ctypes.c_uint32(int(display_id)))
+    # argtypes already converts to uint32 — no c_uint32 wrapper needed
+    uuid_ref = cs.CGDisplayCreateUUIDFromDisplayID(int(display_id))
     if not uuid_ref:
         return None
 
@@ -724,9 +1162,7 @@ def _resolve_display_for_source(source_name):
                 src_h = obs.obs_source_get_height(source)
                 if src_w and src_h:
                     for d in _all_displays:
-                        phys_w = int(d["w"] * d.get("retina_scale", 1.0))
-                        phys_h = int(d["h"] * d.get("retina_scale", 1.0))
-                        if phys_w == src_w and phys_h == src_h:
+                        if d["phys_w"] == src_w and d["phys_h"] == src_h:
                             obs.script_log(obs.LOG_INFO,
                                            f"Click Pop: matched display by "
                                            f"dimensions {src_w}x{src_h}")
@@ -832,19 +1268,220 @@ def _resolve_captured_display():
     _captured_display = _resolve_display_for_source(name)
 
 
-def _get_capture_transform(scene, source_name=None):
-    """Read crop / position / scale from the named Display Capture source.
+def _invalidate_transform_cache(calldata=None):
+    """Mark cached capture transforms stale (also used as a signal callback)."""
+    global _transform_cache_dirty
+    _transform_cache_dirty = True
 
-    Checks both the scene-item crop (Edit Transform) and Crop/Pad filters.
 
-    Returns ``(crop_left, crop_top, pos_x, pos_y, scale_x, scale_y)``
-    or ``None`` if no source name is configured or the source isn't found.
+def _on_scene_item_changed(calldata):
+    """Scene ``item_transform`` / ``item_add`` callback.
+
+    Ignores our own circle items — every click moves one of them.
+    """
+    item = obs.calldata_sceneitem(calldata, "item")
+    if item is not None:
+        name = obs.obs_source_get_name(obs.obs_sceneitem_get_source(item))
+        if name and name.startswith(_CIRCLE_PREFIX):
+            return
+    _invalidate_transform_cache()
+
+
+def _on_scene_item_removed(calldata):
+    """Scene ``item_remove`` callback — cached scene items may now dangle."""
+    _scene_item_cache.clear()
+    _capture_item_cache.clear()
+    _invalidate_transform_cache()
+
+
+def _on_filter_added(calldata):
+    """Capture source ``filter_add`` callback: also watch a new Crop/Pad."""
+    _invalidate_transform_cache()
+    flt = obs.calldata_source(calldata, "filter")
+    if (flt is not None
+            and obs.obs_source_get_unversioned_id(flt) == "crop_filter"):
+        _watch_weak(flt, _FILTER_SIGNALS)
+
+
+# Signals that mean a cached capture transform or scene item may be stale.
+# The scene reports item moves / resizes / crops and items coming and
+# going; the capture source reports settings edits (source-level crop) and
+# filters being added or removed; each of its Crop/Pad filters, whatever
+# it is named, reports its own settings edits (one added later is watched
+# from its filter_add).
+#
+# Not covered: a change in the capture source's own resolution (display
+# mode switch, window resize) emits none of these, yet it moves the
+# bounding-box scale of items with a bounds type.  Such items keep their
+# cached transform until some other edit or a scene switch invalidates it.
+_SCENE_SIGNALS = (
+    ("item_transform", _on_scene_item_changed),
+    ("item_add", _on_scene_item_changed),
+    ("item_remove", _on_scene_item_removed),
+)
+_SOURCE_SIGNALS = (
+    ("update", _invalidate_transform_cache),
+    ("filter_add", _on_filter_added),
+    ("filter_remove", _invalidate_transform_cache),
+)
+_FILTER_SIGNALS = (
+    ("update", _invalidate_transform_cache),
+)
+
+
+def _capture_source_names():
+    """Return the names of the capture sources clicks are mapped through."""
+    if _multi_capture_mode:
+        return [info["source_name"] for info in _display_capture_map.values()]
+    name = _settings.get("capture_source", "")
+    if not name or name == _ALL_CAPTURES_LABEL:
+        return []
+    return [name]
+
+
+def _connect_scene_signals():
+    """(Re)connect the signals that invalidate the transform / item caches.
+
+    Holds a reference to the current scene until
+    ``_disconnect_scene_signals`` runs.  Capture sources and their filters
+    are watched through weak references only, so deleting one in OBS
+    frees it even while the listener runs.
     """
+    global _current_scene_src, _current_scene
+    _disconnect_scene_signals()
+    _invalidate_transform_cache()
+    _scene_item_cache.clear()
+    _capture_item_cache.clear()
+
+    scene_src = obs.obs_frontend_get_current_scene()
+    if scene_src is not None:
+        handler = obs.obs_source_get_signal_handler(scene_src)
+        for sig, callback in _SCENE_SIGNALS:
+            obs.signal_handler_connect(handler, sig, callback)
+        _signal_refs.append((scene_src, handler, _SCENE_SIGNALS))
+        # Watching it keeps the reference alive, so the tick can use it
+        # until the next scene switch instead of asking the frontend.
+        _current_scene_src = scene_src
+        _current_scene = obs.obs_scene_from_source(scene_src)
+    for name in _capture_source_names():
+        source = obs.obs_get_source_by_name(name)
+        if source is not None:
+            _watch_weak(source, _SOURCE_SIGNALS)
+            # Edits to a filter's settings are signalled on the filter itself
+            for filter_name in _crop_filter_names(source):
+                flt = obs.obs_source_get_filter_by_name(source, filter_name)
+                if flt is not None:
+                    _watch_weak(flt, _FILTER_SIGNALS)
+                    obs.obs_source_release(flt)
+            obs.obs_source_release(source)
+
+
+def _watch_weak(source, signals):
+    """Connect *signals* on *source*, remembering it only by weak reference.
+
+    The caller keeps ownership of its own reference to *source*.
+    """
+    handler = obs.obs_source_get_signal_handler(source)
+    for sig, callback in signals:
+        obs.signal_handler_connect(handler, sig, callback)
+    _weak_signal_refs.append((obs.obs_source_get_weak_source(source), signals))
+
+
+def _watch_group_scene(group_scene):
+    """Watch the group scene holding a grouped capture item.
+
+    Moves, crops and removals of an item inside a group are signalled on
+    the group's own scene, not on the scene the group sits in.
+    """
+    group_src = obs.obs_scene_get_source(group_scene)
+    name = obs.obs_source_get_name(group_src)
+    if name in _watched_groups:
+        return
+    _watched_groups.add(name)
+    _watch_weak(group_src, _SCENE_SIGNALS)
+
+
+def _disconnect_scene_signals():
+    """Disconnect cache-invalidation signals and release watched sources."""
+    global _current_scene_src, _current_scene
+    _current_scene_src = None
+    _current_scene = None
+    for source, handler, signals in _signal_refs:
+        for sig, callback in signals:
+            obs.signal_handler_disconnect(handler, sig, callback)
+        obs.obs_source_release(source)
+    _signal_refs.clear()
+    for weak, signals in _weak_signal_refs:
+        # A source that has since been destroyed took its handler (and our
+        # connections) with it
+        source = obs.obs_weak_source_get_source(weak)
+        if source is not None:
+            handler = obs.obs_source_get_signal_handler(source)
+            for sig, callback in signals:
+                obs.signal_handler_disconnect(handler, sig, callback)
+            obs.obs_source_release(source)
+        obs.obs_weak_source_release(weak)
+    _weak_signal_refs.clear()
+    _watched_groups.clear()
+
+
+def _get_capture_transform(scene, source_name=None):
+    """Return the (cached) capture transform for the named source.
+
+    The transform is recomputed by ``_read_capture_transform`` only after
+    ``_invalidate_transform_cache`` has run — on settings changes, scene
+    switches, and OBS signals for item transforms / source updates — so
+    the click hot path is a dict lookup.
+    """
+    global _transform_cache_dirty
     name = source_name or _settings.get("capture_source", "")
     if not name or name == _ALL_CAPTURES_LABEL:
         return None
 
-    item = obs.obs_scene_find_source_recursive(scene, name)
+    if _transform_cache_dirty:
+        _transform_cache.clear()
+        _transform_cache_dirty = False
+    try:
+        return _transform_cache[name]
+    except KeyError:
+        pass
+    transform = _read_capture_transform(scene, name)
+    _transform_cache[name] = transform
+    return transform
+
+
+def _find_capture_item(scene, name):
+    """Return the scene item for capture source *name*, or ``None``.
+
+    The recursive scene walk runs once per scene / capture source; the
+    item is kept across transform invalidations (a dragged item is still
+    the same item) and dropped on scene switches, settings changes and
+    item removal.  Only items directly in *scene* are kept: an item inside
+    a group is removed on the group's own scene, so it is walked to again
+    on every lookup; that scene is watched from then on so edits inside
+    the group still invalidate the transform.
+    """
+    item = _capture_item_cache.get(name)
+    if item is None:
+        item = obs.obs_scene_find_source_recursive(scene, name)
+        if item is not None:
+            parent = obs.obs_sceneitem_get_scene(item)
+            if parent == scene:
+                _capture_item_cache[name] = item
+            elif parent is not None and _signal_refs:  # watcher connected
+                _watch_group_scene(parent)
+    return item
+
+
+def _read_capture_transform(scene, name):
+    """Read crop / position / scale from the named Display Capture source.
+
+    Checks both the scene-item crop (Edit Transform) and Crop/Pad filters.
+
+    Returns ``(crop_left, crop_top, pos_x, pos_y, scale_x, scale_y)``
+    or ``None`` if the source isn't found in *scene*.
+    """
+    item = _find_capture_item(scene, name)
     if item is None:
         return None
 
@@ -923,52 +1560,192 @@ def _get_capture_transform(scene, source_name=None):
 
 
 # ---------------------------------------------------------------------------
-# OBS timer callback — runs on the UI thread
+# Click ring buffer — pynput thread → OBS timer
 # ---------------------------------------------------------------------------
+#
+# Single producer (the pynput listener thread) and single consumer (the OBS
+# timer), so plain index updates under the GIL are enough: the producer
+# stores the slot *before* publishing the new tail, and only ever writes the
+# tail; the consumer only ever writes the head.  Capacity is fixed, so a
+# runaway input source (macro, stuck button) can't grow memory — when the
+# producer laps the consumer the oldest clicks are dropped.
+
+_CLICK_RING_MASK = len(_click_ring) - 1  # capacity is a power of two
 
-def _poll_clicks():
-    now = time.time()
-    duration_s = _settings["duration_ms"] / 1000.0
 
-    # Drain new clicks from the queue
-    while _click_queue:
-        x, y, is_left, t = _click_queue.popleft()
-        _spawn_circle(x, y, is_left, t + duration_s)
+def _enqueue_click(click):
+    """Producer side: append *click* to the ring (pynput thread)."""
+    global _ring_tail
+    tail = _ring_tail
+    _click_ring[tail & _CLICK_RING_MASK] = click
+    _ring_tail = tail + 1
 
-    # Expire old circles
-    still_active, expired = expire_circles(_active_clicks, now)
-    for name in expired:
-        _hide_source(name)
-    _active_clicks[:] = still_active
 
+def _drain_clicks():
+    """Consumer side: return all queued clicks, oldest first (OBS timer)."""
+    global _ring_head
+    tail = _ring_tail
+    ring, mask = _click_ring, _CLICK_RING_MASK  # locals for the comprehension
+    head = max(_ring_head, tail - len(ring))  # drop what was overwritten
+    clicks = [ring[i & mask] for i in range(head, tail)]
+    _ring_head = tail
+    return clicks
+
+
+# ---------------------------------------------------------------------------
+# OBS timer callback — runs on the UI thread
+# ---------------------------------------------------------------------------
 
-def _spawn_circle(x, y, is_left, expire_time):
+def _poll_clicks():
+    now = time.monotonic()
+    # Clicks are stamped here, at most one timer interval after they happened
+    expire_time = now + _settings["duration_ms"] / 1000.0
+    clicks = coalesce_clicks(_drain_clicks())
+
+    # Resolve the current scene once per tick, and only when there is
+    # something to spawn or hide — idle ticks make no OBS calls.
+    if clicks or (_active_clicks and _active_clicks[0][0] <= now):
+        scene_src, scene, canvas = _get_current_scene_and_canvas()
+        try:
+            # Map first: clicks on displays that aren't captured are
+            # discarded here, and must not count against the pool below.
+            placed = []
+            map_click = _map_click
+            for x, y, is_left in clicks:
+                pos = map_click(x, y, scene, canvas)
+                if pos is not None:
+                    placed.append((pos[0], pos[1], is_left))
+            place = _place_circle
+            for obs_x, obs_y, is_left in trim_to_pool(placed,
+                                                      _settings["max_circles"]):
+                place(is_left, obs_x, obs_y, expire_time, scene)
+
+            # Expire old circles
+            for name in expire_circles(_active_clicks, now):
+                _hide_source(name, scene)
+        finally:
+            if scene_src is not None:
+                _source_release(scene_src)
+
+
+def _spawn_circle(x, y, is_left, expire_time, scene=None, canvas=None):
     """Create or reuse an image source and position it at (x, y).
 
     Coordinates (x, y) are in virtual-desktop space (as reported by pynput).
     Multi-monitor aware: determines which display was clicked, converts to
     display-local coordinates, and discards clicks on non-captured displays.
+
+    *scene* and *canvas* (``(canvas_w, canvas_h)``) are the current scene
+    as already resolved by the caller for this tick; when *canvas* is
+    omitted they are looked up here.
+    """
+    if canvas is None:
+        scene_src, scene, canvas = _get_current_scene_and_canvas()
+        try:
+            _spawn_circle(x, y, is_left, expire_time, scene, canvas)
+        finally:
+            if scene_src is not None:
+                _source_release(scene_src)
+        return
+
+    pos = _map_click(x, y, scene, canvas)
+    if pos is not None:
+        _place_circle(is_left, pos[0], pos[1], expire_time, scene)
+
+
+def _map_click(x, y, scene, canvas):
+    """Map a virtual-desktop click to its circle's canvas position.
+
+    Returns ``(obs_x, obs_y)``, or ``None`` when the click is discarded
+    (it landed on a display that isn't being captured).  *scene* and
+    *canvas* are as for ``_spawn_circle``.
+    """
+    # Fast path — single display, no capture source, no Retina scaling:
+    # the mapping is a fixed scale and offset per canvas size.
+    if (len(_all_displays) <= 1 and not _settings["capture_source"]
+            and _retina_scale == 1.0):
+        scale_x, scale_y, half = _fast_mapping(*canvas)
+        return (x * scale_x - half, y * scale_y - half)
+
+    mapping = _click_mapping(x, y, scene, *canvas)
+    if mapping is None:
+        return None
+
+    local_x, local_y, params = mapping
+    scale_x, scale_y, off_x, off_y = _affine_for(params)
+    return (local_x * scale_x + off_x, local_y * scale_y + off_y)
+
+
+def _affine_for(params):
+    """Return the cached ``coord_affine`` fold of a ``_click_mapping`` *params*.
+
+    Keyed by the parameters themselves, so a settings, display or capture
+    transform change simply misses; the cache is bounded by dropping it
+    when it grows past a handful of entries.
+    """
+    affine = _affine_cache.get(params)
+    if affine is None:
+        if len(_affine_cache) >= _AFFINE_CACHE_MAX:
+            _affine_cache.clear()
+        affine = _affine_cache[params] = coord_affine(*params)
+    return affine
+
+
+def _fast_mapping(canvas_w, canvas_h):
+    """Return ``(scale_x, scale_y, half_size)`` for the settings-only mapping.
+
+    Cached per canvas size; ``script_update`` drops the cache when the
+    monitor size or circle size may have changed.
+    """
+    key = (canvas_w, canvas_h)
+    params = _fast_mapping_cache.get(key)
+    if params is None:
+        params = (canvas_w / _settings["monitor_w"],
+                  canvas_h / _settings["monitor_h"],
+                  _settings["circle_size"] / 2)
+        _fast_mapping_cache.clear()
+        _fast_mapping_cache[key] = params
+    return params
+
+
+def _click_mapping(x, y, scene, canvas_w, canvas_h):
+    """Resolve what a click at virtual-desktop (x, y) maps through.
+
+    Returns ``(local_x, local_y, params)`` where *params* is the tuple of
+    remaining positional ``map_coords`` arguments, or ``None`` when the
+    click landed on a display that isn't being captured.
     """
     # --- Multi-monitor: determine which display the click landed on ---
     # Only use per-display logic when multiple displays are detected.
     # Single-display setups fall through to the legacy path so that the
     # user's manual monitor_w / monitor_h settings are always respected.
+    global _last_display, _last_bounds
     display = None
     capture_source_name = None  # used in multi-capture mode
     if len(_all_displays) > 1:
-        display = find_display_for_point(x, y, _all_displays)
+        # Consecutive clicks usually land on the same display
+        bounds = _last_bounds
+        if bounds is not None and bounds[0] <= x < bounds[2] and bounds[1] <= y < bounds[3]:
+            display = _last_display
+        else:
+            display = find_display_for_point(x, y, _all_displays, _display_index)
+            if display is not None:
+                _last_display = display
+                _last_bounds = (display["x"], display["y"],
+                                display["x"] + display["w"],
+                                display["y"] + display["h"])
 
         if _multi_capture_mode:
             if display is not None and display["id"] in _display_capture_map:
                 capture_source_name = _display_capture_map[display["id"]]["source_name"]
             else:
-                return  # no capture source for this display
+                return None  # no capture source for this display
         else:
             # If a specific display is being captured, discard clicks on other
             # displays.  Only applies when we have multiple displays — single
             # display should never discard.
             if _captured_display is not None and display is not _captured_display:
-                return
+                return None
 
     # Use display-specific values when a multi-monitor hit was found,
     # otherwise fall back to settings (preserves single-display behavior).
@@ -985,40 +1762,12 @@ def _spawn_circle(x, y, is_left, expire_time):
         mon_h = _settings["monitor_h"]
         retina = _retina_scale
 
-    # Pick a source name from a pool so we can show multiple simultaneous
-    prefix = "__click_pop_L_" if is_left else "__click_pop_R_"
-    max_c = _settings["max_circles"]
-
-    src_name, evicted = allocate_slot(prefix, max_c, _active_clicks)
-    if evicted is not None:
-        _hide_source(evicted)
-
-    image_path = _settings["left_image"] if is_left else _settings["right_image"]
     size = _settings["circle_size"]
-
-    # Map mouse coords → OBS canvas coords
-    scene_src = obs.obs_frontend_get_current_scene()
-    canvas_w = obs.obs_source_get_width(scene_src) or _settings["monitor_w"]
-    canvas_h = obs.obs_source_get_height(scene_src) or _settings["monitor_h"]
-    scene = obs.obs_scene_from_source(scene_src)
-    transform = _get_capture_transform(scene, capture_source_name) if scene else None
-    obs.obs_source_release(scene_src)
-
-    kwargs = {}
-    if transform is not None:
-        crop_left, crop_top, pos_x, pos_y, scale_x, scale_y = transform
-        kwargs = dict(crop_left=crop_left, crop_top=crop_top,
-                      capture_pos_x=pos_x, capture_pos_y=pos_y,
-                      capture_scale_x=scale_x, capture_scale_y=scale_y)
-
-    # On macOS Retina, pynput reports logical "points" but OBS and the
-    # capture source work in physical pixels (2x on HiDPI).  Scale both
-    # the mouse coords and monitor dimensions so everything is in the
-    # same pixel space.  retina is 1.0 on non-Retina / non-macOS.
-    phys_x = local_x * retina
-    phys_y = local_y * retina
-    phys_mon_w = mon_w * retina
-    phys_mon_h = mon_h * retina
+    # Common case: no capture source configured — skip the transform
+    # lookup entirely and use proportional mapping.
+    transform = None
+    if scene is not None and (capture_source_name or _settings["capture_source"]):
+        transform = _get_capture_transform(scene, capture_source_name)
 
     # When no capture source transform is available but we detected
     # multiple displays, the display-local coords with single-monitor
@@ -1026,21 +1775,41 @@ def _spawn_circle(x, y, is_left, expire_time):
     # 3840 / 1920 = 2.0).  Fall back to global coords mapped across the
     # entire virtual desktop so the proportional mapping stays correct.
     if transform is None and display is not None:
-        vd_left = min(d["x"] for d in _all_displays)
-        vd_top = min(d["y"] for d in _all_displays)
-        vd_right = max(d["x"] + d["w"] for d in _all_displays)
-        vd_bottom = max(d["y"] + d["h"] for d in _all_displays)
-        phys_x = (x - vd_left) * retina
-        phys_y = (y - vd_top) * retina
-        phys_mon_w = (vd_right - vd_left) * retina
-        phys_mon_h = (vd_bottom - vd_top) * retina
+        vd_left, vd_top, vd_right, vd_bottom = _desktop_bounds
+        local_x = x - vd_left
+        local_y = y - vd_top
+        mon_w = vd_right - vd_left
+        mon_h = vd_bottom - vd_top
+
+    if transform is None:
+        transform = (0, 0, 0, 0, None, None)
+    # On macOS Retina, pynput reports logical "points" but OBS and the
+    # capture source work in physical pixels (2x on HiDPI).  The retina
+    # factor rides along as the last parameter and is folded into the
+    # mapping's scale (coord_affine), so the click coords stay logical
+    # here.  retina is 1.0 on non-Retina / non-macOS.
+    return (local_x, local_y,
+            (canvas_w, canvas_h, mon_w, mon_h, size) + transform + (retina,))
 
-    obs_x, obs_y = map_coords(phys_x, phys_y, canvas_w, canvas_h,
-                              phys_mon_w, phys_mon_h,
-                              size, **kwargs)
 
-    _show_source(src_name, image_path, obs_x, obs_y, size)
-    _active_clicks.append((src_name, expire_time))
+def _place_circle(is_left, obs_x, obs_y, expire_time, scene):
+    """Show a pooled circle source at canvas position (obs_x, obs_y)."""
+    # Pick a source name from a pool so we can show multiple simultaneous
+    # circles; free slots are handed out round-robin, and a full pool gives
+    # up the circle closest to expiring.
+    prefix = _LEFT_PREFIX if is_left else _RIGHT_PREFIX
+    pool = _slot_pool(prefix)
+    slot, evicted = next_slot(pool, _slot_cursors[prefix], _active_clicks)
+    _slot_cursors[prefix] = slot + 1
+    src_name = pool[slot]
+    if evicted is not None:
+        _hide_source(evicted, scene)
+
+    settings = _settings
+    image_path = settings["left_image"] if is_left else settings["right_image"]
+    _show_source(src_name, image_path, obs_x, obs_y, settings["circle_size"],
+                 scene)
+    heapq.heappush(_active_clicks, (expire_time, src_name))
 
 
 # ---------------------------------------------------------------------------
@@ -1048,19 +1817,77 @@ def _spawn_circle(x, y, is_left, expire_time):
 # ---------------------------------------------------------------------------
 
 def _get_current_scene():
-    scene_source = obs.obs_frontend_get_current_scene()
+    if _current_scene is not None:
+        return _current_scene
+    scene_source = _frontend_get_current_scene()
     # obs_scene_from_source does not increment the ref count — no release needed for scene
-    scene = obs.obs_scene_from_source(scene_source)
-    obs.obs_source_release(scene_source)
+    scene = _scene_from_source(scene_source)
+    _source_release(scene_source)
     return scene
 
 
-def _show_source(name, image_path, x, y, size):
-    scene = _get_current_scene()
+def _get_current_scene_and_canvas():
+    """Return ``(scene_source, scene, (canvas_w, canvas_h))``.
+
+    While the scene signals are connected the current scene is already held
+    (``_current_scene``) and *scene_source* is ``None``; otherwise the
+    caller owns the *scene_source* reference and must release it once done
+    with *scene*.  Canvas size falls back to the monitor settings.
+    """
+    scene_source = _current_scene_src
+    if scene_source is not None:
+        owned = None
+        scene = _current_scene
+    else:
+        owned = scene_source = _frontend_get_current_scene()
+        scene = _scene_from_source(scene_source)
+    canvas_w = _source_get_width(scene_source) or _settings["monitor_w"]
+    canvas_h = _source_get_height(scene_source) or _settings["monitor_h"]
+    return (owned, scene, (canvas_w, canvas_h))
+
+
+_file_settings = None     # reused file-only obs_data for _set_image_file
+
+
+def _set_image_file(source, image_path):
+    """Point an image source at *image_path*.
+
+    ``obs_source_update`` merges the given settings into the source's own,
+    so a single reused ``{"file": ...}`` object is enough — no copy of the
+    full settings is fetched and released per update.  It is released in
+    ``script_unload``.
+    """
+    global _file_settings
+    if _file_settings is None:
+        _file_settings = obs.obs_data_create()
+    obs.obs_data_set_string(_file_settings, "file", image_path)
+    obs.obs_source_update(source, _file_settings)
+
+
+def _find_scene_item(scene, name):
+    """Return the scene item for circle source *name*, or ``None``.
+
+    Served from ``_scene_item_cache`` when possible; the cache is dropped on
+    scene switches, item removal and cleanup, so entries never dangle.
+    """
+    scene_item = _scene_item_cache.get(name)
+    if scene_item is None:
+        # A (re)found or soon-to-be-created item needs its transform applied
+        _scale_cache.pop(name, None)
+        _pos_cache.pop(name, None)
+        scene_item = _scene_find_source(scene, name)
+        if scene_item is not None:
+            _scene_item_cache[name] = scene_item
+    return scene_item
+
+
+def _show_source(name, image_path, x, y, size, scene=None):
+    if scene is None:
+        scene = _get_current_scene()
     if scene is None:
         return
 
-    scene_item = obs.obs_scene_find_source(scene, name)
+    scene_item = _find_scene_item(scene, name)
 
     if scene_item is None:
         # Source not in scene — check if it exists globally (e.g. from a
@@ -1071,49 +1898,76 @@ def _show_source(name, image_path, x, y, size):
             obs.obs_data_set_string(settings, "file", image_path)
             source = obs.obs_source_create("image_source", name, settings, None)
             obs.obs_data_release(settings)
-        else:
+        elif _source_image_cache.get(name) != image_path:
             # Update image path on reused source (may be stale from a
             # previous session or OBS restart).
-            settings = obs.obs_source_get_settings(source)
-            obs.obs_data_set_string(settings, "file", image_path)
-            obs.obs_source_update(source, settings)
-            obs.obs_data_release(settings)
+            _set_image_file(source, image_path)
+        _source_image_cache[name] = image_path
         scene_item = obs.obs_scene_add(scene, source)
         obs.obs_source_release(source)
-    else:
+        _scene_item_cache[name] = scene_item
+    elif _source_image_cache.get(name) != image_path:
         # Update the image path in case it changed
         source = obs.obs_sceneitem_get_source(scene_item)
-        settings = obs.obs_source_get_settings(source)
-        obs.obs_data_set_string(settings, "file", image_path)
-        obs.obs_source_update(source, settings)
-        obs.obs_data_release(settings)
-
-    # Position and scale
-    pos = obs.vec2()
-    pos.x = x
-    pos.y = y
-    obs.obs_sceneitem_set_pos(scene_item, pos)
-
-    # Scale the source to the desired circle size
-    source = obs.obs_sceneitem_get_source(scene_item)
-    src_w = obs.obs_source_get_width(source)
-    if src_w and src_w > 0:
-        s = size / src_w
-        scale = obs.vec2()
-        scale.x = s
-        scale.y = s
-        obs.obs_sceneitem_set_scale(scene_item, scale)
+        _set_image_file(source, image_path)
+        _source_image_cache[name] = image_path
+        _scale_cache.pop(name, None)  # the new image may differ in width
 
-    obs.obs_sceneitem_set_visible(scene_item, True)
+    # Apply position, scale and visibility as one deferred update so the
+    # item's transform is recomputed once rather than per setter.
+    _sceneitem_defer_update_begin(scene_item)
+    try:
+        # Position and scale.  A repeat click within a pixel of where the
+        # circle already is only needs the visibility flip.
+        last = _pos_cache.get(name)
+        if last is None or abs(last[0] - x) >= 1 or abs(last[1] - y) >= 1:
+            pos = _pos_vec
+            pos.x = x
+            pos.y = y
+            _sceneitem_set_pos(scene_item, pos)
+            _pos_cache[name] = (x, y)
+
+        # Scale the source to the desired circle size.  The image's width only
+        # changes with its file, so once a scale is applied for this size the
+        # width isn't even read again.
+        applied = _scale_cache.get(name)
+        if applied is None or applied[0] != size:
+            source = _sceneitem_get_source(scene_item)
+            src_w = _source_get_width(source)
+            if src_w and src_w > 0 and applied != (size, src_w):
+                s = size / src_w
+                scale = _scale_vec
+                scale.x = s
+                scale.y = s
+                _sceneitem_set_scale(scene_item, scale)
+                _scale_cache[name] = (size, src_w)
+
+        _sceneitem_set_visible(scene_item, True)
+    finally:
+        _sceneitem_defer_update_end(scene_item)
 
 
-def _hide_source(name):
-    scene = _get_current_scene()
+def _hide_source(name, scene=None):
+    if scene is None:
+        scene = _get_current_scene()
     if scene is None:
         return
-    scene_item = obs.obs_scene_find_source(scene, name)
+    scene_item = _find_scene_item(scene, name)
     if scene_item is not None:
-        obs.obs_sceneitem_set_visible(scene_item, False)
+        _sceneitem_set_visible(scene_item, False)
+
+
+def _slot_pool(prefix):
+    """Return the source names pooled under *prefix* for ``max_circles``.
+
+    Built once per ``max_circles`` value so allocation reuses the same
+    string objects instead of formatting a name per click.
+    """
+    pool = _slot_pools.get(prefix)
+    if pool is None or len(pool) != _settings["max_circles"]:
+        pool = _slot_pools[prefix] = slot_names(prefix, _settings["max_circles"])
+        _slot_cursors[prefix] = 0
+    return pool
 
 
 def _cleanup_sources():
@@ -1121,15 +1975,23 @@ def _cleanup_sources():
     scene = _get_current_scene()
     if scene is None:
         return
-    max_c = _settings["max_circles"]
-    for prefix in ("__click_pop_L_", "__click_pop_R_"):
-        for i in range(max_c):
-            name = f"{prefix}{i}"
-            scene_item = obs.obs_scene_find_source(scene, name)
+    for prefix in (_LEFT_PREFIX, _RIGHT_PREFIX):
+        for name in _slot_pool(prefix):
+            # Items shown this session are cached; the rest are still probed
+            # so leftovers saved with the scene collection get removed too.
+            scene_item = _scene_item_cache.get(name)
+            if scene_item is None:
+                scene_item = _scene_find_source(scene, name)
             if scene_item is not None:
                 obs.obs_sceneitem_remove(scene_item)
             source = obs.obs_get_source_by_name(name)
             if source is not None:
                 obs.obs_source_remove(source)
-                obs.obs_source_release(source)
+                _source_release(source)
     _active_clicks.clear()
+    for prefix in _slot_cursors:
+        _slot_cursors[prefix] = 0
+    _source_image_cache.clear()
+    _scene_item_cache.clear()
+    _scale_cache.clear()
+    _pos_cache.clear()
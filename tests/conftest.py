@@ -1,7 +1,6 @@
 """Shared fixtures for Tier 1 and Tier 2 tests."""
 
 import sys
-import importlib
 from unittest.mock import MagicMock
 
 import pytest
@@ -139,17 +138,16 @@ def mock_obs(request):
 def obs_script(mock_obs):
     """Import ``obs_click_pop`` with a fresh module-level state.
 
-    The module is forcibly reloaded so each test starts with clean globals.
+    Any cached copy is dropped from ``sys.modules`` and the module is
+    imported anew against the mock, so each test starts with clean globals.
     Returns the module object.
     """
-    # Remove cached module so reload picks up the mock
     sys.modules.pop("obs_click_pop", None)
     import obs_click_pop
-    importlib.reload(obs_click_pop)  # ensure clean state
 
     # Reset mutable globals
     obs_click_pop._listener = None
-    obs_click_pop._click_queue.clear()
+    obs_click_pop._ring_head = obs_click_pop._ring_tail = 0
     obs_click_pop._timer_active = False
     obs_click_pop._active_clicks.clear()
     obs_click_pop._display_capture_map = {}
@@ -1,37 +1,49 @@
 """Tier 1 — §1.3: Circle expiration (pure logic, no OBS)."""
 
+import heapq
+
 from click_pop_core import expire_circles
 
 
 def test_nothing_expired():
-    active = [("a", 10.0), ("b", 11.0)]
-    still, expired = expire_circles(active, 9.0)
-    assert [n for n, _ in still] == ["a", "b"]
+    active = [(10.0, "a"), (11.0, "b")]
+    expired = list(expire_circles(active, 9.0))
+    assert [n for _, n in active] == ["a", "b"]
     assert expired == []
 
 
 def test_one_expired():
-    active = [("a", 10.0), ("b", 11.0)]
-    still, expired = expire_circles(active, 10.5)
-    assert [n for n, _ in still] == ["b"]
+    active = [(10.0, "a"), (11.0, "b")]
+    expired = list(expire_circles(active, 10.5))
+    assert [n for _, n in active] == ["b"]
     assert expired == ["a"]
 
 
 def test_all_expired():
-    active = [("a", 10.0), ("b", 11.0)]
-    still, expired = expire_circles(active, 12.0)
-    assert still == []
+    active = [(10.0, "a"), (11.0, "b")]
+    expired = list(expire_circles(active, 12.0))
+    assert active == []
     assert expired == ["a", "b"]
 
 
 def test_empty_list():
-    still, expired = expire_circles([], 10.0)
-    assert still == []
+    active = []
+    expired = list(expire_circles(active, 10.0))
+    assert active == []
     assert expired == []
 
 
 def test_exact_boundary_expires():
-    active = [("a", 10.0)]
-    still, expired = expire_circles(active, 10.0)
-    assert still == []
+    active = [(10.0, "a")]
+    expired = list(expire_circles(active, 10.0))
+    assert active == []
     assert expired == ["a"]
+
+
+def test_expires_in_time_order_regardless_of_push_order():
+    active = []
+    for exp, name in [(12.0, "c"), (10.0, "a"), (13.0, "d"), (11.0, "b")]:
+        heapq.heappush(active, (exp, name))
+    expired = list(expire_circles(active, 11.5))
+    assert expired == ["a", "b"]
+    assert sorted(n for _, n in active) == ["c", "d"]
@@ -0,0 +1,43 @@
+"""Tier 1: Coalescing repeated clicks (pure logic, no OBS)."""
+
+from click_pop_core import coalesce_clicks, trim_to_pool
+
+
+def test_distinct_clicks_untouched():
+    clicks = [(1, 2, True), (3, 4, True), (1, 2, False)]
+    assert coalesce_clicks(clicks) == clicks
+
+
+def test_duplicates_collapse_in_first_seen_order():
+    clicks = [(5, 5, True), (9, 9, False), (5, 5, True)]
+    assert coalesce_clicks(clicks) == [(5, 5, True), (9, 9, False)]
+
+
+def test_empty():
+    assert coalesce_clicks([]) == []
+
+
+def test_nearby_repeat_of_same_button_dropped():
+    clicks = [(100, 100, True), (101, 102, True), (104, 100, True)]
+    assert coalesce_clicks(clicks) == [(100, 100, True), (104, 100, True)]
+
+
+def test_nearby_click_of_other_button_kept():
+    clicks = [(100, 100, True), (101, 100, False)]
+    assert coalesce_clicks(clicks) == clicks
+
+
+def test_radius_zero_only_drops_exact_repeats():
+    clicks = [(100, 100, True), (101, 100, True), (100, 100, True)]
+    assert coalesce_clicks(clicks, radius=0) == [(100, 100, True), (101, 100, True)]
+
+
+def test_trim_keeps_newest_per_button():
+    clicks = [(i, 0, i % 2 == 0) for i in range(8)]
+    assert trim_to_pool(clicks, 2) == [(4, 0, True), (5, 0, False),
+                                       (6, 0, True), (7, 0, False)]
+
+
+def test_trim_noop_within_pool():
+    clicks = [(1, 1, True), (2, 2, True)]
+    assert trim_to_pool(clicks, 5) is clicks
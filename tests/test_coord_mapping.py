@@ -1,7 +1,7 @@
 """Tier 1 — §1.1: Coordinate mapping (pure logic, no OBS)."""
 
 import pytest
-from click_pop_core import map_coords
+from click_pop_core import coord_affine, map_coords
 
 
 @pytest.mark.parametrize(
@@ -119,3 +119,44 @@ def test_map_coords_retina_prescaled(x, y, canvas_w, canvas_h,
     """Verify map_coords works when coords are pre-scaled to physical pixels."""
     result = map_coords(x, y, canvas_w, canvas_h, monitor_w, monitor_h, size)
     assert result == pytest.approx(expected, abs=1.0)
+
+
+# -------------------------------------------------------------------
+# Folded affine mapping
+# -------------------------------------------------------------------
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        dict(crop_left=960, crop_top=0, capture_pos_x=0, capture_pos_y=0,
+             capture_scale_x=1.0, capture_scale_y=1.0),
+        dict(crop_left=640, crop_top=100, capture_pos_x=100, capture_pos_y=50,
+             capture_scale_x=0.5, capture_scale_y=0.5),
+        dict(crop_left=640, crop_top=100, capture_pos_x=100, capture_pos_y=50,
+             capture_scale_x=0.5, capture_scale_y=0.25),
+    ],
+    ids=["proportional", "right_half_crop", "crop_scale_offset",
+         "anisotropic_scale"],
+)
+def test_coord_affine_matches_scalar(kwargs):
+    sx, sy, ox, oy = coord_affine(1280, 720, 1920, 1080, 80, **kwargs)
+    for x, y in zip([0, 300, 960, 1440, 1919], [0, 200, 540, 700, 1079]):
+        assert (x * sx + ox, y * sy + oy) == pytest.approx(
+            map_coords(x, y, 1280, 720, 1920, 1080, 80, **kwargs))
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{}, dict(crop_left=100, crop_top=40, capture_pos_x=10, capture_pos_y=20,
+              capture_scale_x=0.5, capture_scale_y=0.5)],
+    ids=["proportional", "transformed"],
+)
+def test_retina_folded_matches_prescaled(kwargs):
+    """Passing retina= equals pre-multiplying coords and monitor size."""
+    prescaled = map_coords(840 * 2.0, 525 * 2.0, 1920, 1080, 1680 * 2.0,
+                           1050 * 2.0, 80, **kwargs)
+    assert map_coords(840, 525, 1920, 1080, 1680, 1050, 80, retina=2.0,
+                      **kwargs) == pytest.approx(prescaled)
+    sx, sy, ox, oy = coord_affine(1920, 1080, 1680, 1050, 80, retina=2.0, **kwargs)
+    assert (840 * sx + ox, 525 * sy + oy) == pytest.approx(prescaled)
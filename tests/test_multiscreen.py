@@ -1,7 +1,7 @@
 """Tests for multi-screen support: display hit-testing and coordinate mapping."""
 
 import pytest
-from click_pop_core import find_display_for_point, map_coords
+from click_pop_core import build_display_index, find_display_for_point, map_coords
 
 
 # ---------------------------------------------------------------------------
@@ -592,3 +592,225 @@ class TestVirtualDesktopFallback:
         # scale = 4480/4480 = 1.0
         assert obs_x == pytest.approx(930.0)
         assert obs_y == pytest.approx(510.0)
+
+
+# ---------------------------------------------------------------------------
+# Grid-indexed hit-testing
+# ---------------------------------------------------------------------------
+
+# Secondary to the left of the primary — negative virtual-desktop coords.
+DUAL_NEGATIVE_ORIGIN = [
+    {"id": 1, "x": 0, "y": 0, "w": 1920, "h": 1080, "retina_scale": 1.0},
+    {"id": 2, "x": -2560, "y": -200, "w": 2560, "h": 1440, "retina_scale": 1.0},
+]
+
+
+class TestDisplayIndex:
+    """The grid index must give exactly the same answers as the linear scan."""
+
+    @pytest.mark.parametrize(
+        "displays",
+        [DUAL_SIDE_BY_SIDE, DUAL_VERTICAL, DUAL_RETINA_MIXED, TRIPLE_L_SHAPE,
+         SINGLE, DUAL_DPI_PHYSICAL, DUAL_IDENTICAL, DUAL_NEGATIVE_ORIGIN, []],
+        ids=["side_by_side", "vertical", "retina_mixed", "triple_l", "single",
+             "dpi_physical", "identical", "negative_origin", "empty"],
+    )
+    def test_index_matches_linear_scan(self, displays):
+        index = build_display_index(displays)
+        for x in range(-2600, 4600, 97):
+            for y in range(-300, 2300, 89):
+                assert (find_display_for_point(x, y, displays, index)
+                        is find_display_for_point(x, y, displays))
+
+    def test_boundaries_with_index(self):
+        index = build_display_index(DUAL_SIDE_BY_SIDE)
+        assert find_display_for_point(1919, 500, DUAL_SIDE_BY_SIDE, index) is DUAL_SIDE_BY_SIDE[0]
+        assert find_display_for_point(1920, 500, DUAL_SIDE_BY_SIDE, index) is DUAL_SIDE_BY_SIDE[1]
+        assert find_display_for_point(4480, 0, DUAL_SIDE_BY_SIDE, index) is None
+
+    def test_fractional_point_left_of_origin(self):
+        index = build_display_index(DUAL_NEGATIVE_ORIGIN)
+        d = find_display_for_point(-0.5, 10, DUAL_NEGATIVE_ORIGIN, index)
+        assert d is DUAL_NEGATIVE_ORIGIN[1]
+
+
+def test_screen_size_is_memoized_until_refresh(obs_script, monkeypatch):
+    """_detect_screen_size enumerates once; _refresh_displays re-detects."""
+    calls = []
+
+    def _fake_detect(force=False):
+        calls.append(1)
+        return [dict(SINGLE[0], w=2560 + len(calls), h=1440)]
+
+    monkeypatch.setattr(obs_script, "_detect_all_displays", _fake_detect)
+    assert obs_script._detect_screen_size() == (2561, 1440)
+    assert obs_script._detect_screen_size() == (2561, 1440)
+    assert len(calls) == 1
+
+    obs_script._refresh_displays(force=True)
+    assert obs_script._detect_screen_size() == (2562, 1440)
+    assert len(calls) == 2
+
+
+def test_display_enumeration_cached_until_forced(obs_script, monkeypatch):
+    """Platform probes run once per TTL window unless forced."""
+    calls = []
+
+    def _fake_impl():
+        calls.append(1)
+        return list(SINGLE)
+
+    monkeypatch.setattr(obs_script, "_detect_displays_impl", _fake_impl)
+    first = obs_script._detect_all_displays()
+    assert obs_script._detect_all_displays() is first
+    assert len(calls) == 1
+
+    obs_script._detect_all_displays(force=True)
+    assert len(calls) == 2
+
+    obs_script._display_cache["ts"] -= obs_script._DISPLAY_CACHE_TTL
+    obs_script._detect_all_displays()
+    assert len(calls) == 3
+
+
+def test_linux_enumeration_falls_back_to_xrandr_cli(obs_script, monkeypatch):
+    """Without libXrandr (or an X display) the xrandr(1) parser is used."""
+    def _no_lib():
+        raise OSError("libXrandr unavailable")
+
+    monkeypatch.setattr(obs_script, "_detect_displays_xrandr_lib", _no_lib)
+    monkeypatch.setattr(obs_script, "_detect_displays_xrandr_cli",
+                        lambda: list(SINGLE))
+    assert obs_script._detect_displays_linux() == SINGLE
+
+
+def test_xrandr_missing_symbol_falls_back_to_cli(obs_script, monkeypatch):
+    """A libXrandr without one of our calls counts as unavailable."""
+    import ctypes
+
+    class _OldLib:
+        def __getattr__(self, name):
+            if name == "XRRGetOutputInfo":
+                raise AttributeError(name)
+            return ctypes.CFUNCTYPE(None)()
+
+    monkeypatch.setattr(obs_script, "_xrandr_api", None)
+    monkeypatch.setattr(ctypes.cdll, "LoadLibrary", lambda name: _OldLib())
+    monkeypatch.setattr(obs_script, "_detect_displays_xrandr_cli",
+                        lambda: list(SINGLE))
+
+    assert obs_script._detect_displays_linux() == SINGLE
+    assert obs_script._xrandr_api is False
+
+
+def test_xrandr_lib_lists_displays_in_output_order(obs_script, monkeypatch):
+    """Display ids follow output order (xshm's screen numbering), not CRTCs."""
+    from types import SimpleNamespace as NS
+
+    def _ptr(**fields):
+        return NS(contents=NS(**fields))
+
+    # Output 0 drives CRTC 20 (right), output 1 is off, output 2 drives
+    # CRTC 10 (left) — CRTC order would swap the two screens.
+    outputs = {100: _ptr(crtc=20, connection=0), 101: _ptr(crtc=0, connection=1),
+               102: _ptr(crtc=10, connection=0)}
+    crtcs = {10: _ptr(x=0, y=0, width=1920, height=1080, mode=1),
+             20: _ptr(x=1920, y=0, width=2560, height=1440, mode=1)}
+    res = _ptr(noutput=3, outputs=[100, 101, 102], ncrtc=2, crtcs=[10, 20])
+    x11 = NS(XOpenDisplay=lambda _: 1, XDefaultRootWindow=lambda _: 0,
+             XCloseDisplay=lambda _: 0)
+    xrandr = NS(XRRGetScreenResourcesCurrent=lambda *a: res,
+                XRRFreeScreenResources=lambda _: None,
+                XRRGetOutputInfo=lambda d, r, o: outputs[o],
+                XRRFreeOutputInfo=lambda _: None,
+                XRRGetCrtcInfo=lambda d, r, c: crtcs[c],
+                XRRFreeCrtcInfo=lambda _: None)
+    monkeypatch.setattr(obs_script, "_xrandr_api", (x11, xrandr))
+
+    displays = obs_script._detect_displays_xrandr_lib()
+    assert [(d["id"], d["x"], d["w"]) for d in displays] == [
+        (0, 1920, 2560), (1, 0, 1920)]
+
+
+def test_display_uuid_memoized_until_refresh(obs_script, monkeypatch):
+    """Each display's UUID is read once per display enumeration."""
+    calls = []
+
+    def _fake_read(display_id):
+        calls.append(display_id)
+        return f"UUID-{display_id}"
+
+    monkeypatch.setattr(obs_script, "_read_display_uuid", _fake_read)
+    assert obs_script._display_uuid_via_ctypes(7) == "UUID-7"
+    assert obs_script._display_uuid_via_ctypes(7) == "UUID-7"
+    assert calls == [7]
+
+    obs_script._refresh_displays(force=True)
+    obs_script._display_uuid_via_ctypes(7)
+    assert calls == [7, 7]
+
+
+def test_repeat_clicks_reuse_last_display(obs_script, monkeypatch):
+    """Clicks on the previous click's display skip the display lookup."""
+    obs_script._set_displays(DUAL_SIDE_BY_SIDE)
+    calls = []
+
+    def _counting_find(*args):
+        calls.append(args[:2])
+        return find_display_for_point(*args)
+
+    monkeypatch.setattr(obs_script, "find_display_for_point", _counting_find)
+    obs_script._click_mapping(100, 100, None, 1920, 1080)
+    obs_script._click_mapping(200, 300, None, 1920, 1080)
+    assert calls == [(100, 100)]
+    assert obs_script._last_display is DUAL_SIDE_BY_SIDE[0]
+
+    obs_script._click_mapping(2000, 100, None, 1920, 1080)
+    assert calls == [(100, 100), (2000, 100)]
+    assert obs_script._last_display is DUAL_SIDE_BY_SIDE[1]
+
+
+def test_set_displays_precomputes_desktop_bounds(obs_script):
+    """The virtual-desktop box is derived once per layout, not per click."""
+    obs_script._set_displays(DUAL_NEGATIVE_ORIGIN)
+    assert obs_script._desktop_bounds == (-2560, -200, 1920, 1240)
+
+    # No capture transform: clicks map across the whole virtual desktop
+    local_x, local_y, params = obs_script._click_mapping(-2560, -200, None,
+                                                         1920, 1080)
+    assert (local_x, local_y) == (0, 0)
+    assert params[2:4] == (4480, 1440)
+
+
+def test_discarded_clicks_do_not_count_against_the_pool(obs_script, mock_obs):
+    """Clicks on an uncaptured display can't crowd out captured ones."""
+    mock_obs.obs_scene_find_source.return_value = None  # create path
+    obs_script._set_displays(DUAL_SIDE_BY_SIDE)
+    obs_script._captured_display = DUAL_SIDE_BY_SIDE[0]
+    obs_script._settings["max_circles"] = 2
+    for click in [(100, 100, True), (200, 200, True),
+                  (2000, 100, True), (2100, 200, True)]:
+        obs_script._enqueue_click(click)
+
+    obs_script._poll_clicks()
+
+    assert sorted(n for _, n in obs_script._active_clicks) == [
+        "__click_pop_L_0", "__click_pop_L_1"]
+
+
+def test_xrandr_cli_parses_connected_outputs(obs_script, monkeypatch):
+    """Only connected outputs with a geometry become displays."""
+    out = (b"Screen 0: minimum 8 x 8, current 3840 x 1080, maximum 32767 x 32767\n"
+           b"HDMI-1 connected primary 1920x1080+0+0 (normal left) 527mm x 296mm\n"
+           b"   1920x1080     60.00*+\n"
+           b"DP-1 connected 1920x1080+1920+0 (normal left) 527mm x 296mm\n"
+           b"DP-2 disconnected (normal left inverted right x axis y axis)\n"
+           b"DP-3 connected (normal left inverted right x axis y axis)\n")
+    monkeypatch.setattr(obs_script.subprocess, "check_output", lambda *a, **k: out)
+
+    displays = obs_script._detect_displays_xrandr_cli()
+
+    assert [(d["id"], d["x"], d["y"], d["w"], d["h"]) for d in displays] == [
+        (0, 0, 0, 1920, 1080), (1, 1920, 0, 1920, 1080)]
+    # Every enumerator fills in the physical size the capture match uses
+    assert all((d["phys_w"], d["phys_h"]) == (d["w"], d["h"]) for d in displays)
@@ -1,65 +1,60 @@
 """Tier 1 — §1.2: Pool slot allocation (pure logic, no OBS)."""
 
-from click_pop_core import allocate_slot
+import heapq
+
+from click_pop_core import next_slot, slot_names
 
 
 def test_empty_pool_returns_slot_0():
-    active = []
-    name, evicted = allocate_slot("__click_pop_L_", 5, active)
-    assert name == "__click_pop_L_0"
-    assert evicted is None
+    assert next_slot(slot_names("__click_pop_L_", 5), 0, []) == (0, None)
 
 
-def test_slot_0_busy_returns_slot_1():
-    active = [("__click_pop_L_0", 99.0)]
-    name, evicted = allocate_slot("__click_pop_L_", 5, active)
-    assert name == "__click_pop_L_1"
-    assert evicted is None
+def test_max_1_slot_busy_evicts():
+    active = [(100.0, "__click_pop_L_0")]
+    assert next_slot(slot_names("__click_pop_L_", 1), 1, active) == (
+        0, "__click_pop_L_0")
+    assert active == []
 
 
-def test_all_slots_busy_evicts_oldest():
-    active = [(f"__click_pop_L_{i}", 100.0 + i) for i in range(5)]
-    name, evicted = allocate_slot("__click_pop_L_", 5, active)
-    assert name == "__click_pop_L_0"
-    assert evicted == "__click_pop_L_0"
-    # The evicted entry should have been removed from active_clicks
-    assert all(n != "__click_pop_L_0" for n, _ in active)
+def test_next_slot_cycles_through_pool():
+    names = slot_names("__click_pop_L_", 3)
+    picked = [next_slot(names, cursor, [])[0] for cursor in range(5)]
+    assert picked == [0, 1, 2, 0, 1]
 
 
-def test_left_full_right_gets_slot_0():
-    active = [(f"__click_pop_L_{i}", 100.0 + i) for i in range(5)]
-    name, evicted = allocate_slot("__click_pop_R_", 5, active)
-    assert name == "__click_pop_R_0"
-    assert evicted is None
+def test_next_slot_skips_busy_slot_for_free_one():
+    """A slot still showing is passed over while another is free."""
+    names = slot_names("__click_pop_L_", 3)
+    active = [(100.0, "__click_pop_L_0"), (101.0, "__click_pop_L_1")]
+    assert next_slot(names, 0, active) == (2, None)
+    assert len(active) == 2
 
 
-def test_gap_in_pool_fills_gap():
-    active = [
-        ("__click_pop_L_0", 100.0),
-        ("__click_pop_L_1", 101.0),
-        ("__click_pop_L_3", 103.0),
+def test_next_slot_full_pool_evicts_soonest_expiring():
+    names = slot_names("__click_pop_L_", 2)
+    active = []
+    for exp, name in [(101.0, "__click_pop_L_0"), (100.0, "__click_pop_R_0"),
+                      (102.0, "__click_pop_L_1")]:
+        heapq.heappush(active, (exp, name))
+    assert next_slot(names, 2, active) == (0, "__click_pop_L_0")
+    assert [heapq.heappop(active)[1] for _ in range(len(active))] == [
+        "__click_pop_R_0", "__click_pop_L_1",
     ]
-    name, evicted = allocate_slot("__click_pop_L_", 5, active)
-    assert name == "__click_pop_L_2"
-    assert evicted is None
 
 
-def test_max_1_slot_busy_evicts():
-    active = [("__click_pop_L_0", 100.0)]
-    name, evicted = allocate_slot("__click_pop_L_", 1, active)
-    assert name == "__click_pop_L_0"
-    assert evicted == "__click_pop_L_0"
-
-
-def test_mixed_lr_evicts_correct_type():
-    active = [
-        ("__click_pop_R_0", 100.0),
-        ("__click_pop_L_0", 101.0),
-        ("__click_pop_L_1", 102.0),
-    ]
-    name, evicted = allocate_slot("__click_pop_L_", 2, active)
-    # Should evict the oldest L entry, not the R entry
-    assert evicted == "__click_pop_L_0"
-    assert name == "__click_pop_L_0"
-    # R_0 should still be in active
-    assert ("__click_pop_R_0", 100.0) in active
+def test_next_slot_evicts_by_expiry_not_cursor():
+    """After a shortened duration the cursor's slot isn't the oldest one."""
+    names = slot_names("__click_pop_L_", 2)
+    active = []
+    # L_1 was placed last but with a shorter duration, so it expires first
+    heapq.heappush(active, (105.0, "__click_pop_L_0"))
+    heapq.heappush(active, (102.0, "__click_pop_L_1"))
+    assert next_slot(names, 0, active) == (1, "__click_pop_L_1")
+    assert active == [(105.0, "__click_pop_L_0")]
+
+
+def test_next_slot_free_slot_evicts_nothing():
+    names = slot_names("__click_pop_R_", 2)
+    active = [(100.0, "__click_pop_L_1")]
+    assert next_slot(names, 1, active) == (1, None)
+    assert active == [(100.0, "__click_pop_L_1")]
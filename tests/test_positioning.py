@@ -1,6 +1,7 @@
 """Tier 2 — §2.3: Source positioning (mock obspython)."""
 
 import pytest
+from click_pop_core import map_coords
 from tests.conftest import Vec2
 
 
@@ -44,3 +45,80 @@ def test_zero_width_skips_scale(obs_script, mock_obs):
     obs_script._show_source("test_src", "/img.png", 0, 0, 80)
 
     mock_obs.obs_sceneitem_set_scale.assert_not_called()
+
+
+def test_unchanged_scale_not_reapplied(obs_script, mock_obs):
+    """Repeat clicks at the same size set the scale once; a new size re-applies."""
+    mock_obs.obs_scene_find_source.return_value = mock_obs.MagicMock(name="item")
+
+    obs_script._show_source("test_src", "/img.png", 0, 0, 160)
+    obs_script._show_source("test_src", "/img.png", 10, 10, 160)
+    assert mock_obs.obs_sceneitem_set_scale.call_count == 1
+
+    obs_script._show_source("test_src", "/img.png", 20, 20, 80)
+    assert mock_obs.obs_sceneitem_set_scale.call_count == 2
+    assert mock_obs.obs_sceneitem_set_scale.call_args[0][1].x == pytest.approx(1.0)
+
+
+def test_fast_path_matches_general_mapping(obs_script, mock_obs):
+    """The single-display fast path lands where map_coords would put it."""
+    mock_obs.obs_scene_find_source.return_value = None  # create path
+    obs_script._settings.update(monitor_w=2560, monitor_h=1440, circle_size=50)
+
+    obs_script._spawn_circle(700, 300, True, 1.0, mock_obs._scene, (1920, 1080))
+
+    local_x, local_y, params = obs_script._click_mapping(
+        700, 300, mock_obs._scene, 1920, 1080)
+    expected = map_coords(local_x, local_y, *params)
+    pos = mock_obs.obs_sceneitem_set_pos.call_args[0][1]
+    assert (pos.x, pos.y) == pytest.approx(expected)
+
+
+def test_width_not_reread_once_scaled(obs_script, mock_obs):
+    """After the scale is applied, repeat clicks don't query the image width."""
+    mock_obs.obs_scene_find_source.return_value = mock_obs.MagicMock(name="item")
+
+    obs_script._show_source("test_src", "/img.png", 0, 0, 160)
+    assert mock_obs.obs_source_get_width.call_count == 1
+    obs_script._show_source("test_src", "/img.png", 10, 10, 160)
+    assert mock_obs.obs_source_get_width.call_count == 1
+
+    # A new image may have a different width
+    obs_script._show_source("test_src", "/other.png", 20, 20, 160)
+    assert mock_obs.obs_source_get_width.call_count == 2
+
+
+def test_transform_updates_are_deferred(obs_script, mock_obs):
+    """Position, scale and visibility are applied inside one deferred update."""
+    item = mock_obs.MagicMock(name="item")
+    mock_obs.obs_scene_find_source.return_value = item
+
+    obs_script._show_source("test_src", "/img.png", 0, 0, 160)
+
+    mock_obs.obs_sceneitem_defer_update_begin.assert_called_once_with(item)
+    mock_obs.obs_sceneitem_defer_update_end.assert_called_once_with(item)
+
+
+def test_pos_vec2_reused_across_clicks(obs_script, mock_obs):
+    """No vec2 is allocated per click for the position."""
+    mock_obs.obs_scene_find_source.return_value = mock_obs.MagicMock(name="item")
+
+    obs_script._show_source("a", "/img.png", 1, 2, 160)
+    first = mock_obs.obs_sceneitem_set_pos.call_args[0][1]
+    obs_script._show_source("b", "/img.png", 3, 4, 160)
+
+    assert mock_obs.obs_sceneitem_set_pos.call_args[0][1] is first
+    assert (first.x, first.y) == (3, 4)
+
+
+def test_subpixel_move_skips_set_pos(obs_script, mock_obs):
+    """A repeat at (nearly) the same spot doesn't push a new position."""
+    mock_obs.obs_scene_find_source.return_value = mock_obs.MagicMock(name="item")
+
+    obs_script._show_source("test_src", "/img.png", 100.0, 200.0, 80)
+    obs_script._show_source("test_src", "/img.png", 100.4, 199.7, 80)
+    assert mock_obs.obs_sceneitem_set_pos.call_count == 1
+    assert mock_obs.obs_sceneitem_set_visible.call_count == 2
+
+    obs_script._show_source("test_src", "/img.png", 101.0, 200.0, 80)
+    assert mock_obs.obs_sceneitem_set_pos.call_count == 2
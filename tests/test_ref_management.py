@@ -12,12 +12,34 @@ def test_get_current_scene_releases_source(obs_script, mock_obs):
 def test_spawn_circle_releases_scene_source(obs_script, mock_obs):
     """_spawn_circle releases the scene source obtained for canvas dimensions."""
     obs_script._spawn_circle(100, 100, True, 999.0)
-    # _spawn_circle calls obs_frontend_get_current_scene for canvas dims,
-    # then _show_source also calls _get_current_scene internally.
-    # Both should release their scene source.
+    # _spawn_circle resolves the current scene once and threads it through
+    # to _show_source, so there is exactly one acquire / release pair.
     release_calls = mock_obs.obs_source_release.call_args_list
     scene_source_releases = [c for c in release_calls if c == call(mock_obs._scene_source)]
-    assert len(scene_source_releases) >= 2  # once in _spawn_circle, once in _show_source
+    assert mock_obs.obs_frontend_get_current_scene.call_count == 1
+    assert len(scene_source_releases) == 1
+
+
+def test_poll_resolves_scene_once_per_tick(obs_script, mock_obs):
+    """A tick with several clicks acquires and releases the scene once."""
+    for i in range(3):
+        obs_script._enqueue_click((100 * i, 100, True))
+
+    obs_script._poll_clicks()
+
+    release_calls = mock_obs.obs_source_release.call_args_list
+    scene_source_releases = [c for c in release_calls if c == call(mock_obs._scene_source)]
+    assert mock_obs.obs_frontend_get_current_scene.call_count == 1
+    assert len(scene_source_releases) == 1
+
+
+def test_idle_poll_makes_no_scene_calls(obs_script, mock_obs):
+    """With nothing queued and nothing expiring, a tick doesn't touch OBS."""
+    obs_script._active_clicks.append((float("inf"), "__click_pop_L_0"))
+
+    obs_script._poll_clicks()
+
+    mock_obs.obs_frontend_get_current_scene.assert_not_called()
 
 
 def test_show_source_releases_on_create_path(obs_script, mock_obs):
@@ -45,15 +67,23 @@ def test_show_source_reuses_global_source(obs_script, mock_obs):
     assert call(mock_obs._global_source) in source_release_calls
 
 
-def test_show_source_releases_on_update_path(obs_script, mock_obs):
-    """On the update path, obs_data_release is called for the settings."""
+def test_show_source_reuses_file_settings_on_update_path(obs_script, mock_obs):
+    """On the update path, one file-only settings object is reused and only
+    released on unload."""
     from unittest.mock import MagicMock
     scene_item = MagicMock(name="existing_item")
     mock_obs.obs_scene_find_source.return_value = scene_item  # update path
 
     obs_script._show_source("test_src", "/img.png", 100.0, 200.0, 80)
+    obs_script._show_source("test_src", "/other.png", 100.0, 200.0, 80)
+
+    mock_obs.obs_source_get_settings.assert_not_called()
+    mock_obs.obs_data_create.assert_called_once()
+    mock_obs.obs_data_release.assert_not_called()
+    assert mock_obs.obs_source_update.call_args[0][1] is mock_obs._created_settings
 
-    mock_obs.obs_data_release.assert_called_once_with(mock_obs._existing_settings)
+    obs_script.script_unload()
+    mock_obs.obs_data_release.assert_called_once_with(mock_obs._created_settings)
 
 
 def test_cleanup_sources_releases_all(obs_script, mock_obs):
@@ -73,3 +103,31 @@ def test_cleanup_sources_releases_all(obs_script, mock_obs):
     assert mock_obs.obs_source_remove.call_count == expected_count
     # obs_source_release: 1 for _get_current_scene + N for each global source
     assert mock_obs.obs_source_release.call_count == 1 + expected_count
+
+
+def test_show_source_skips_update_when_image_unchanged(obs_script, mock_obs):
+    """Repeat clicks with the same image don't re-apply the source settings."""
+    from unittest.mock import MagicMock
+    mock_obs.obs_scene_find_source.return_value = MagicMock(name="existing_item")
+
+    obs_script._show_source("test_src", "/img.png", 100.0, 200.0, 80)
+    obs_script._show_source("test_src", "/img.png", 110.0, 210.0, 80)
+    assert mock_obs.obs_source_update.call_count == 1
+
+    obs_script._show_source("test_src", "/other.png", 120.0, 220.0, 80)
+    assert mock_obs.obs_source_update.call_count == 2
+
+
+def test_scene_item_lookup_is_cached(obs_script, mock_obs):
+    """Repeat clicks on one slot walk the scene once; item removal resets it."""
+    from unittest.mock import MagicMock
+    mock_obs.obs_scene_find_source.return_value = MagicMock(name="existing_item")
+
+    obs_script._show_source("test_src", "/img.png", 100.0, 200.0, 80)
+    obs_script._show_source("test_src", "/img.png", 110.0, 210.0, 80)
+    obs_script._hide_source("test_src")
+    assert mock_obs.obs_scene_find_source.call_count == 1
+
+    obs_script._on_scene_item_removed(None)
+    obs_script._show_source("test_src", "/img.png", 120.0, 220.0, 80)
+    assert mock_obs.obs_scene_find_source.call_count == 2
@@ -0,0 +1,282 @@
+"""Tier 2 — capture transform cache (mock obspython)."""
+
+import pytest
+
+
+TRANSFORM = (10, 20, 0.0, 0.0, 1.0, 1.0)
+
+
+@pytest.fixture()
+def reads(obs_script, monkeypatch):
+    """Count calls to the uncached transform reader."""
+    calls = []
+
+    def _fake_read(scene, name):
+        calls.append(name)
+        return TRANSFORM
+
+    monkeypatch.setattr(obs_script, "_read_capture_transform", _fake_read)
+    obs_script._settings["capture_source"] = "Display Capture"
+    return calls
+
+
+def test_no_capture_source_returns_none(obs_script, reads):
+    obs_script._settings["capture_source"] = ""
+    assert obs_script._get_capture_transform(object()) is None
+    assert reads == []
+
+
+def test_repeated_lookups_hit_cache(obs_script, reads):
+    scene = object()
+    assert obs_script._get_capture_transform(scene) == TRANSFORM
+    assert obs_script._get_capture_transform(scene) == TRANSFORM
+    assert reads == ["Display Capture"]
+
+
+def test_invalidate_forces_reread(obs_script, reads):
+    scene = object()
+    obs_script._get_capture_transform(scene)
+    obs_script._invalidate_transform_cache(None)  # as called by a signal
+    obs_script._get_capture_transform(scene)
+    assert reads == ["Display Capture", "Display Capture"]
+
+
+def test_missing_source_is_cached_too(obs_script, monkeypatch):
+    calls = []
+
+    def _fake_read(scene, name):
+        calls.append(name)
+        return None
+
+    monkeypatch.setattr(obs_script, "_read_capture_transform", _fake_read)
+    obs_script._get_capture_transform(object(), "Gone")
+    obs_script._get_capture_transform(object(), "Gone")
+    assert calls == ["Gone"]
+
+
+def test_connect_signals_watches_scene_and_capture_source(obs_script, mock_obs):
+    obs_script._settings["capture_source"] = "Display Capture"
+    mock_obs.obs_data_array_count.return_value = 1
+    mock_obs.obs_data_get_json.return_value = (
+        '{"id": "crop_filter", "name": "Crop/Pad"}')
+    obs_script._connect_scene_signals()
+
+    connected = {c.args[1] for c in mock_obs.signal_handler_connect.call_args_list}
+    assert {"item_transform", "item_remove", "update"} <= connected
+
+    # Only the scene is held; the capture source and its filter are not
+    assert len(obs_script._signal_refs) == 1
+    assert mock_obs.obs_source_release.call_count == 2
+
+    obs_script._disconnect_scene_signals()
+    assert (mock_obs.signal_handler_disconnect.call_count
+            == mock_obs.signal_handler_connect.call_count)
+    assert obs_script._signal_refs == []
+    assert obs_script._weak_signal_refs == []
+    assert mock_obs.obs_weak_source_release.call_count == 2
+
+
+def test_deleted_capture_source_is_not_disconnected(obs_script, mock_obs):
+    """A watched source destroyed meanwhile is skipped on disconnect."""
+    obs_script._settings["capture_source"] = "Display Capture"
+    mock_obs.obs_source_filter_count.return_value = 0
+    obs_script._connect_scene_signals()
+    mock_obs.obs_weak_source_get_source.return_value = None
+
+    obs_script._disconnect_scene_signals()
+    disconnected = {c.args[1] for c in mock_obs.signal_handler_disconnect.call_args_list}
+    assert disconnected == {"item_transform", "item_add", "item_remove"}
+    mock_obs.obs_weak_source_release.assert_called_once()
+
+
+def test_connect_signals_watches_every_crop_filter(obs_script, mock_obs):
+    """Renamed or localized Crop/Pad filters are watched too."""
+    obs_script._settings["capture_source"] = "Display Capture"
+    mock_obs.obs_data_array_count.return_value = 3
+    mock_obs.obs_data_get_json.side_effect = [
+        '{"id": "crop_filter", "name": "Zuschneiden/Auff\u00fcllen"}',
+        '{"id": "color_filter", "name": "Color Correction"}',
+        '{"id": "crop_filter", "name": "Trim menu bar"}',
+    ]
+    obs_script._connect_scene_signals()
+
+    looked_up = [c.args[1] for c in
+                 mock_obs.obs_source_get_filter_by_name.call_args_list]
+    assert looked_up == ["Zuschneiden/Auff\u00fcllen", "Trim menu bar"]
+    assert len(obs_script._weak_signal_refs) == 3  # source + two filters
+
+
+def test_added_crop_filter_is_watched(obs_script, mock_obs):
+    flt = mock_obs.MagicMock(name="crop_filter")
+    mock_obs.calldata_source.return_value = flt
+    mock_obs.obs_source_get_unversioned_id.return_value = "crop_filter"
+    obs_script._transform_cache_dirty = False
+
+    obs_script._on_filter_added(object())
+    assert obs_script._transform_cache_dirty
+    mock_obs.obs_source_get_weak_source.assert_called_once_with(flt)
+
+    mock_obs.obs_source_get_unversioned_id.return_value = "color_filter"
+    obs_script._on_filter_added(object())
+    assert len(obs_script._weak_signal_refs) == 1
+
+
+def test_own_circle_moves_keep_transform_cache(obs_script, mock_obs, reads):
+    """Repositioning a circle emits item_transform — that must not invalidate."""
+    mock_obs.obs_source_get_name.return_value = "__click_pop_L_0"
+    obs_script._get_capture_transform(object())
+    obs_script._on_scene_item_changed(object())
+    obs_script._get_capture_transform(object())
+    assert reads == ["Display Capture"]
+
+    mock_obs.obs_source_get_name.return_value = "Display Capture"
+    obs_script._on_scene_item_changed(object())
+    obs_script._get_capture_transform(object())
+    assert len(reads) == 2
+
+
+def test_filter_crop_read_from_named_filter(obs_script, mock_obs):
+    crop = {"left": 5, "top": 6, "right": 7, "bottom": 8}
+    flt = mock_obs.MagicMock(name="crop_filter")
+    mock_obs.obs_source_get_filter_by_name.return_value = flt
+    mock_obs.obs_source_get_unversioned_id.return_value = "crop_filter"
+    mock_obs.obs_data_get_int.side_effect = lambda data, key: crop[key]
+    mock_obs.obs_source_filter_count.return_value = 1
+
+    assert obs_script._get_filter_crop(object()) == (5, 6, 7, 8)
+    mock_obs.obs_source_backup_filters.assert_not_called()
+    mock_obs.obs_source_release.assert_called_once_with(flt)
+
+
+def test_filter_crop_falls_back_to_backup(obs_script, mock_obs):
+    mock_obs.obs_source_get_filter_by_name.return_value = None
+    mock_obs.obs_data_array_count.return_value = 1
+    mock_obs.obs_data_get_json.return_value = (
+        '{"id": "crop_filter", "settings": {"left": 11, "top": 12}}')
+
+    assert obs_script._get_filter_crop(object()) == (11, 12, 0, 0)
+    mock_obs.obs_data_array_release.assert_called_once()
+
+
+def test_filter_crop_with_several_filters_uses_filter_order(obs_script, mock_obs):
+    """A renamed Crop/Pad listed first wins over one with the default name."""
+    mock_obs.obs_source_filter_count.return_value = 2
+    mock_obs.obs_data_array_count.return_value = 1
+    mock_obs.obs_data_get_json.return_value = (
+        '{"id": "crop_filter", "settings": {"left": 3, "top": 4}}')
+
+    assert obs_script._get_filter_crop(object()) == (3, 4, 0, 0)
+    mock_obs.obs_source_get_filter_by_name.assert_not_called()
+
+
+def test_spawn_without_capture_source_skips_transform(obs_script, mock_obs, monkeypatch):
+    calls = []
+    monkeypatch.setattr(obs_script, "_get_capture_transform",
+                        lambda *a: calls.append(a))
+    obs_script._settings["capture_source"] = ""
+
+    obs_script._spawn_circle(100, 100, True, 999.0)
+
+    assert calls == []
+    mock_obs.obs_sceneitem_set_pos.assert_called_once()
+
+
+def test_capture_item_survives_transform_invalidation(obs_script, mock_obs):
+    """A dragged capture item is re-read without a new recursive scene walk."""
+    mock_obs.obs_sceneitem_get_scene.return_value = mock_obs._scene
+    item = obs_script._find_capture_item(mock_obs._scene, "Display Capture")
+    obs_script._invalidate_transform_cache(None)
+    assert obs_script._find_capture_item(mock_obs._scene, "Display Capture") is item
+    assert mock_obs.obs_scene_find_source_recursive.call_count == 1
+
+    obs_script._on_scene_item_removed(None)
+    obs_script._find_capture_item(mock_obs._scene, "Display Capture")
+    assert mock_obs.obs_scene_find_source_recursive.call_count == 2
+
+
+def test_transform_state_item_ids_parsed_once(obs_script, monkeypatch):
+    """The same transform-states dump is only JSON-parsed once."""
+    dump = ('{"scenes_and_groups": [{"items": [{"id": 1}, {"id": 4}, {}]},'
+            ' {"items": [{"id": 9}]}]}')
+    loads = []
+    real_loads = obs_script.json.loads
+    monkeypatch.setattr(obs_script.json, "loads",
+                        lambda s: loads.append(s) or real_loads(s))
+
+    assert obs_script._transform_state_item_ids(dump) == (1, 4, 9)
+    assert obs_script._transform_state_item_ids(dump) == (1, 4, 9)
+    assert len(loads) == 1
+
+    assert obs_script._transform_state_item_ids('{"scenes_and_groups": []}') == ()
+    assert len(loads) == 2
+
+
+def test_filter_crop_skipped_without_filters(obs_script, mock_obs):
+    mock_obs.obs_source_filter_count.return_value = 0
+
+    assert obs_script._get_filter_crop(object()) == (0, 0, 0, 0)
+    mock_obs.obs_source_get_filter_by_name.assert_not_called()
+    mock_obs.obs_source_backup_filters.assert_not_called()
+
+
+def test_current_scene_held_while_signals_connected(obs_script, mock_obs):
+    """Ticks reuse the watched scene instead of asking the frontend."""
+    obs_script._connect_scene_signals()
+    mock_obs.obs_frontend_get_current_scene.reset_mock()
+
+    scene_src, scene, canvas = obs_script._get_current_scene_and_canvas()
+    assert scene_src is None  # borrowed — nothing for the caller to release
+    assert scene is mock_obs._scene
+    assert canvas == (1920, 1080)
+    assert obs_script._get_current_scene() is mock_obs._scene
+    mock_obs.obs_frontend_get_current_scene.assert_not_called()
+
+    obs_script._disconnect_scene_signals()
+    scene_src, _, _ = obs_script._get_current_scene_and_canvas()
+    assert scene_src is mock_obs._scene_source
+    mock_obs.obs_frontend_get_current_scene.assert_called_once()
+
+
+def test_grouped_capture_item_not_cached(obs_script, mock_obs):
+    """An item inside a group could be removed unseen — never keep it."""
+    group_scene = mock_obs.MagicMock(name="group_scene")
+    mock_obs.obs_sceneitem_get_scene.return_value = group_scene
+
+    obs_script._find_capture_item(mock_obs._scene, "Display Capture")
+    obs_script._find_capture_item(mock_obs._scene, "Display Capture")
+    assert mock_obs.obs_scene_find_source_recursive.call_count == 2
+    assert obs_script._capture_item_cache == {}
+
+
+def test_grouped_capture_item_watches_its_group(obs_script, mock_obs):
+    """Edits inside a group are signalled on the group's scene — watch it once."""
+    obs_script._connect_scene_signals()
+    mock_obs.signal_handler_connect.reset_mock()
+    mock_obs.obs_sceneitem_get_scene.return_value = mock_obs.MagicMock(name="group_scene")
+    mock_obs.obs_source_get_name.return_value = "Group"
+
+    obs_script._find_capture_item(mock_obs._scene, "Display Capture")
+    obs_script._find_capture_item(mock_obs._scene, "Display Capture")
+    connected = [c.args[1] for c in mock_obs.signal_handler_connect.call_args_list]
+    assert connected == ["item_transform", "item_add", "item_remove"]
+
+    obs_script._disconnect_scene_signals()
+    assert obs_script._watched_groups == set()
+
+
+@pytest.mark.parametrize("event", ["OBS_FRONTEND_EVENT_SCENE_COLLECTION_CLEANUP",
+                                   "OBS_FRONTEND_EVENT_EXIT"])
+def test_collection_cleanup_releases_held_scene(obs_script, mock_obs, event):
+    """The old collection's scene isn't kept alive past cleanup / exit."""
+    mock_obs.OBS_FRONTEND_EVENT_SCENE_CHANGED = 0
+    mock_obs.OBS_FRONTEND_EVENT_SCENE_COLLECTION_CLEANUP = 1
+    mock_obs.OBS_FRONTEND_EVENT_EXIT = 2
+    obs_script._connect_scene_signals()
+    obs_script._scene_item_cache["__click_pop_L_0"] = object()
+
+    obs_script._on_frontend_event(getattr(mock_obs, event))
+
+    assert obs_script._current_scene_src is None
+    assert obs_script._signal_refs == []
+    assert obs_script._scene_item_cache == {}
+    mock_obs.obs_source_release.assert_any_call(mock_obs._scene_source)
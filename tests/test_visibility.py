@@ -1,7 +1,10 @@
 """Tier 2 — §2.2: Source visibility lifecycle (mock obspython)."""
 
+import time
 from unittest.mock import call
 
+import pytest
+
 
 def test_new_circle_is_visible(obs_script, mock_obs):
     """_show_source sets the scene item visible."""
@@ -35,3 +38,100 @@ def test_cleanup_removes_scene_items(obs_script, mock_obs):
     max_c = obs_script._settings["max_circles"]
     expected_count = max_c * 2  # L + R
     assert mock_obs.obs_sceneitem_remove.call_count == expected_count
+
+
+@pytest.mark.parametrize("n_clicks", [1, 6], ids=["single", "burst"])
+def test_poll_drains_queue_and_shows_circles(obs_script, mock_obs, n_clicks):
+    """_poll_clicks spawns every queued click and leaves an empty queue."""
+    mock_obs.obs_scene_find_source.return_value = None  # create path
+    for i in range(n_clicks):
+        obs_script._enqueue_click((10 * i, 10 * i, i % 2 == 0))
+
+    obs_script._poll_clicks()
+
+    assert obs_script._drain_clicks() == []
+    assert len(obs_script._active_clicks) == n_clicks
+    assert mock_obs.obs_sceneitem_set_visible.call_count == n_clicks
+
+
+def test_click_ring_drops_oldest_when_full(obs_script):
+    """A producer that laps the consumer loses the oldest clicks, not the newest."""
+    cap = len(obs_script._click_ring)
+    for i in range(cap + 5):
+        obs_script._enqueue_click((i, 0, True))
+
+    clicks = obs_script._drain_clicks()
+
+    assert len(clicks) == cap
+    assert clicks[0][0] == 5
+    assert clicks[-1][0] == cap + 4
+    assert obs_script._drain_clicks() == []
+
+
+def test_poll_coalesces_same_spot_clicks(obs_script, mock_obs):
+    """Auto-fire at one pixel shows a single circle, stamped at poll time."""
+    mock_obs.obs_scene_find_source.return_value = None  # create path
+    for i in range(5):
+        obs_script._enqueue_click((100, 100, True))
+
+    before = time.monotonic()
+    obs_script._poll_clicks()
+
+    assert len(obs_script._active_clicks) == 1
+    duration_s = obs_script._settings["duration_ms"] / 1000.0
+    assert obs_script._active_clicks[0][0] >= before + duration_s
+
+
+def test_poll_skips_clicks_evicted_within_the_tick(obs_script, mock_obs):
+    """A burst larger than the pool only shows the newest max_circles clicks."""
+    mock_obs.obs_scene_find_source.return_value = None  # create path
+    max_c = obs_script._settings["max_circles"]
+    for i in range(max_c + 7):
+        obs_script._enqueue_click((50 * i, 10, True))
+
+    obs_script._poll_clicks()
+
+    assert mock_obs.obs_sceneitem_set_visible.call_count == max_c
+    assert len(obs_script._active_clicks) == max_c
+
+
+def test_cleanup_uses_cached_items(obs_script, mock_obs):
+    """Circles shown this session are removed without a scene lookup."""
+    item = mock_obs.MagicMock(name="item")
+    obs_script._scene_item_cache["__click_pop_L_0"] = item
+    mock_obs.obs_scene_find_source.return_value = None
+
+    obs_script._cleanup_sources()
+
+    mock_obs.obs_sceneitem_remove.assert_called_once_with(item)
+    max_c = obs_script._settings["max_circles"]
+    assert mock_obs.obs_scene_find_source.call_count == max_c * 2 - 1
+
+
+def test_grown_pool_fills_new_slots_before_evicting(obs_script, mock_obs):
+    """Raising max_circles hands out the new slots instead of evicting."""
+    obs_script._settings["max_circles"] = 2
+    for _ in range(3):
+        obs_script._place_circle(True, 0.0, 0.0, 999.0, mock_obs._scene)
+    assert sorted(n for _, n in obs_script._active_clicks) == [
+        "__click_pop_L_0", "__click_pop_L_1"]
+
+    obs_script._settings["max_circles"] = 4
+    obs_script._place_circle(True, 0.0, 0.0, 999.0, mock_obs._scene)
+    obs_script._place_circle(True, 0.0, 0.0, 999.0, mock_obs._scene)
+    assert sorted(n for _, n in obs_script._active_clicks) == [
+        "__click_pop_L_0", "__click_pop_L_1", "__click_pop_L_2", "__click_pop_L_3"]
+
+
+def test_shrunk_pool_evicts_soonest_expiring(obs_script, mock_obs):
+    """Lowering max_circles evicts the oldest circle, not slot 0 by rote."""
+    obs_script._settings["max_circles"] = 3
+    for expire in (10.0, 11.0, 12.0):
+        obs_script._place_circle(True, 0.0, 0.0, expire, mock_obs._scene)
+
+    obs_script._settings["max_circles"] = 2
+    obs_script._place_circle(True, 0.0, 0.0, 13.0, mock_obs._scene)
+    # L_2 is outside the new pool and left to expire; L_0 went first
+    assert sorted(obs_script._active_clicks) == [
+        (11.0, "__click_pop_L_1"), (12.0, "__click_pop_L_2"),
+        (13.0, "__click_pop_L_0")]